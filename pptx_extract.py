@@ -34,7 +34,7 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from pptx_extractor.utils.common import setup_logging, ensure_directory
+from pptx_extractor.utils.common import setup_logging, ensure_directory, clear_slide_caches
 from pptx_extractor.notes.extractor import extract_slide_notes
 from pptx_extractor.animations.extractor import extract_slide_animations
 from pptx_extractor.slides.extractor import extract_slides, extract_slide_text_data
@@ -106,12 +106,12 @@ def parse_arguments():
                         choices=supported_formats.get('extraction_types', ["images", "notes", "animations", "all"]), 
                         help="What to extract: images, notes, animations, all (can specify multiple)")
     parser.add_argument("--format", "-f", 
-                        default=cli_defaults.get('image_format', 'png'), 
                         choices=supported_formats.get('image_formats', ["png", "jpg", "jpeg", "tiff", "bmp"]), 
-                        help=f"Image format for slides (default: {cli_defaults.get('image_format', 'png')})")
+                        help=f"Image format for slides (default: {cli_defaults.get('image_format', 'png')}, or "
+                             f"{cli_defaults.get('recommendation_image_format', 'jpg')} with --recommendation-method images)")
     parser.add_argument("--dpi", "-d", type=int, 
-                        default=cli_defaults.get('dpi', 300), 
-                        help=f"Image resolution for slides (default: {cli_defaults.get('dpi', 300)})")
+                        help=f"Image resolution for slides (default: {cli_defaults.get('dpi', 300)}, or "
+                             f"{cli_defaults.get('recommendation_image_dpi', 150)} with --recommendation-method images)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--recommend", "-r", action="store_true", help="Generate AI-powered usage recommendations for each slide (requires API key)")
     parser.add_argument("--recommendation-method", 
@@ -123,11 +123,24 @@ def parse_arguments():
                         choices=["anthropic", "google"], 
                         default=cli_defaults.get('llm_provider', 'anthropic'), 
                         help=f"LLM provider to use for recommendations (default: {cli_defaults.get('llm_provider', 'anthropic')})")
+    parser.add_argument("--batch", action="store_true", help="Send Anthropic recommendation requests as a single discounted batch (slower to complete; 5+ slides)")
+    parser.add_argument("--no-cache", action="store_true", help="Always request fresh recommendations instead of reusing ones cached from earlier runs")
     parser.add_argument("--slide-nums", help="Specific slide numbers to process (e.g., '1', '1,3,5', '1-5', '1-3,7,9-11')")
     parser.add_argument("--config", help="Path to configuration file (overrides default config)")
     parser.add_argument("--output-filename", default="presentation_content.json", help="Name of the output JSON file (default: presentation_content.json)")
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # Slide images that are only going to an LLM do not need print resolution or lossless
+    # encoding; the models downscale them anyway. An explicit --dpi/--format still wins.
+    llm_images = args.recommend and args.recommendation_method == "images"
+    if args.dpi is None:
+        args.dpi = cli_defaults.get('recommendation_image_dpi', 150) if llm_images else cli_defaults.get('dpi', 300)
+    if args.format is None:
+        args.format = (cli_defaults.get('recommendation_image_format', 'jpg') if llm_images
+                       else cli_defaults.get('image_format', 'png'))
+    
+    return args
 
 def save_json_data(data, output_path, filename):
     """Save data to a JSON file.
@@ -217,7 +230,8 @@ def extract_pptx_content(args):
     # Extract animations if requested
     if extract_animations:
         logger.info("Extracting slide animations...")
-        animation_data = extract_slide_animations(pptx_path, slide_filter)
+        animation_workers = get_config().get('processing.animation_extraction.workers')
+        animation_data = extract_slide_animations(pptx_path, slide_filter, workers=animation_workers)
     
     # Extract slides if requested
     if extract_images:
@@ -230,6 +244,9 @@ def extract_pptx_content(args):
         if slide_paths:
             logger.info(f"Successfully extracted {len(slide_paths)} slides to {slides_dir}")
     
+    # Extraction is done with this deck; release the slides held by the text cache
+    clear_slide_caches()
+    
     # Create a unified JSON in the requested format
     logger.info("Creating unified slide content file...")
     slides_data = {"slides": []}
@@ -298,7 +315,10 @@ def extract_pptx_content(args):
         timeout = calculate_timeout(num_slides_to_process, has_recommendations=True)
         logger.info(f"Estimated processing time: up to {timeout} seconds ({timeout // 60} minutes)")
         
-        slides_data = generate_all_recommendations(slides_data, args.api_key, args.llm_provider, args.recommendation_method)
+        concurrency = get_config().get('processing.recommendations.max_concurrent_requests')
+        slides_data = generate_all_recommendations(slides_data, args.api_key, args.llm_provider, args.recommendation_method,
+                                                   use_cache=not args.no_cache, concurrency=concurrency,
+                                                   use_batch=args.batch)
     
     # Save the unified JSON file
     unified_file = save_json_data(slides_data, output_path, args.output_filename)
@@ -0,0 +1,484 @@
+"""
+Core animation parsing and description routines.
+
+Kept free of zip/package handling so the module can be compiled ahead of time
+with Cython (see setup.py) or run as-is under PyPy.
+"""
+
+import logging
+import re
+# python-pptx depends on lxml, so its compiled XPath lookups are always available
+from lxml import etree
+
+from ..utils.common import NAMESPACES, NS_P
+
+logger = logging.getLogger(__name__)
+
+# Clark-notation tags for animation sequence and effect elements
+_TAG_PAR = NS_P + 'par'
+_TAG_TGTEL = NS_P + 'tgtEl'
+_TAG_ANIMEFFECT = NS_P + 'animEffect'
+_TAG_ANIMCLR = NS_P + 'animClr'
+_TAG_ANIMMOTION = NS_P + 'animMotion'
+_TAG_ANIMSCALE = NS_P + 'animScale'
+_EFFECT_TAGS = frozenset((_TAG_TGTEL, _TAG_ANIMEFFECT, _TAG_ANIMCLR, _TAG_ANIMMOTION, _TAG_ANIMSCALE))
+
+# Animation filter attribute, e.g. "fade", "wipe(right)", "fly(fromBottom)"
+_FILTER_RE = re.compile(r'^([^(]+)(?:\(([^)]*)\))?$')
+
+def _compile_find(path):
+    """
+    Compile a namespaced element path once for repeated lookups.
+    
+    Args:
+        path: Prefixed element path relative to the context element (e.g. 'p:cTn')
+        
+    Returns:
+        callable: Function taking an element and returning the first match or None
+    """
+    xpath = etree.XPath(path, namespaces=NAMESPACES)
+    
+    def find_first(element):
+        matches = xpath(element)
+        return matches[0] if matches else None
+    
+    return find_first
+
+_XP_TIMING = _compile_find('p:timing')
+_XP_TNLST = _compile_find('p:tnLst')
+_XP_CTN = _compile_find('p:cTn')
+_XP_CHILDTNLST = _compile_find('p:childTnLst')
+_XP_SPTGT = _compile_find('p:spTgt')
+_XP_TXEL = _compile_find('p:txEl')
+_XP_PRG = _compile_find('p:pRg')
+_XP_TO = _compile_find('p:to')
+_XP_TO_SRGB = _compile_find('a:srgbClr')
+_XP_BY = _compile_find('p:by')
+_XP_STCONDLST = _compile_find('p:stCondLst')
+_XP_COND = _compile_find('p:cond')
+_XP_TN = _compile_find('p:tn')
+
+def _parse_effect(j, child_par):
+    """
+    Parse a single animation effect node into plain values.
+    
+    Args:
+        j: Position of the effect within its sequence, used for a fallback ID
+        child_par: The effect's <p:par> element
+        
+    Returns:
+        tuple: (effect_id, shape_id, effect_type, effect_subtype, effect_direction,
+            start_condition, delay_ms, duration_ms, build_level), or None if the
+            node has no timing container or target
+    """
+    child_ctn = _XP_CTN(child_par)
+    if child_ctn is None:
+        return None
+    
+    # Get effect ID and duration
+    effect_id = child_ctn.get('id', f'unknown_effect_{j}')
+    effect_dur = child_ctn.get('dur', 'unknown')
+    
+    # Convert duration to milliseconds if it's a number
+    duration_ms = "unknown"
+    if effect_dur != 'unknown' and effect_dur.isdigit():
+        duration_ms = int(effect_dur)
+    
+    # Collect the first target and behaviour elements of each kind in one walk
+    # of the effect subtree instead of one descendant search per element
+    found = {}
+    effect_tags = _EFFECT_TAGS
+    for el in child_par.iter():
+        tag = el.tag
+        if tag in effect_tags and tag not in found:
+            found[tag] = el
+    
+    # Find target shape
+    tgt_el = found.get(_TAG_TGTEL)
+    if tgt_el is None:
+        return None
+        
+    # Get shape ID and check for paragraph target
+    shape_id_el = _XP_SPTGT(tgt_el)
+    shape_id = "unknown"
+    build_level = None
+    if shape_id_el is not None:
+        shape_id = shape_id_el.get('spid', 'unknown')
+        # Check for text animation (by paragraph)
+        txEl = _XP_TXEL(shape_id_el)
+        if txEl is not None:
+            pRg = _XP_PRG(txEl)
+            if pRg is not None:
+                build_level = f"paragraph_{pRg.get('st', '0')}-{pRg.get('end', '0')}"
+    
+    # Find animation effect and its properties
+    anim_effect = found.get(_TAG_ANIMEFFECT)
+    effect_type = "appear"  # default
+    effect_subtype = None
+    effect_direction = None
+    
+    if anim_effect is not None:
+        # Get transition type (for entrance/exit effects)
+        effect_type = anim_effect.get('transition', 'in')
+        filter_attr = anim_effect.get('filter', '')
+        
+        # Parse filter for effect details
+        if filter_attr:
+            # Common patterns: "fade", "wipe(right)", "fly(fromBottom)"
+            match = _FILTER_RE.match(filter_attr)
+            if match:
+                effect_subtype, effect_direction = match.group(1), match.group(2)
+            else:
+                effect_subtype = filter_attr
+    
+    # Check for other animation types
+    if anim_effect is None:
+        # Check for emphasis effects (color change, etc.)
+        anim_clr = found.get(_TAG_ANIMCLR)
+        if anim_clr is not None:
+            effect_type = "emphasis"
+            effect_subtype = "color"
+            # Get color details if needed
+            to_clr = _XP_TO(anim_clr)
+            if to_clr is not None:
+                rgb = _XP_TO_SRGB(to_clr)
+                if rgb is not None:
+                    effect_direction = f"to_color_{rgb.get('val', '')}"
+        
+        # Check for motion path
+        anim_motion = found.get(_TAG_ANIMMOTION)
+        if anim_motion is not None:
+            effect_type = "motion"
+            effect_subtype = "path"
+            path = anim_motion.get('path', '')
+            if path:
+                effect_direction = "custom_path"
+        
+        # Check for scale/rotate
+        anim_scale = found.get(_TAG_ANIMSCALE)
+        if anim_scale is not None:
+            effect_type = "emphasis"
+            effect_subtype = "grow/shrink"
+            by_x = _XP_BY(anim_scale)
+            if by_x is not None:
+                x_val = by_x.get('x', '100000')
+                y_val = by_x.get('y', '100000')
+                effect_direction = f"scale_x{x_val}_y{y_val}"
+    
+    # Find start conditions
+    start_condition = "on_click"  # default
+    delay_ms = 0
+    
+    # Check all conditions
+    stCondLst = _XP_STCONDLST(child_ctn)
+    if stCondLst is not None:
+        cond = _XP_COND(stCondLst)
+        if cond is not None:
+            evt = cond.get('evt', '')
+            delay = cond.get('delay', '0')
+            
+            # Parse trigger
+            if evt == 'onBegin':
+                start_condition = "with_previous"
+            elif evt == 'onClick':
+                start_condition = "on_click"
+            elif delay == 'indefinite':
+                start_condition = "on_click"
+            else:
+                # Check for "after previous" by looking at tn
+                tn = _XP_TN(cond)
+                if tn is not None:
+                    val = tn.get('val', '')
+                    if val == 'indefinite':
+                        start_condition = "after_previous"
+            
+            # Parse delay
+            if delay and delay != 'indefinite' and delay.isdigit():
+                delay_ms = int(delay)
+    
+    return (effect_id, shape_id, effect_type, effect_subtype, effect_direction,
+            start_condition, delay_ms, duration_ms, build_level)
+
+def extract_animation_info(slide):
+    """
+    Extract animation information from a slide.
+    
+    Args:
+        slide: The slide object from python-pptx
+        
+    Yields:
+        dict: Animation information for each effect, in document order
+    """
+    try:
+        # Access the slide's XML element
+        if hasattr(slide, 'element'):
+            slide_xml = slide.element
+        elif hasattr(slide, '_element'):
+            slide_xml = slide._element
+        else:
+            logger.debug(f"Slide does not have element attribute")
+            return
+        
+        # Find timing information
+        timing_node = _XP_TIMING(slide_xml)
+        if timing_node is None:
+            return
+        
+        # Find animation sequences
+        tn_lt = _XP_TNLST(timing_node)
+        if tn_lt is None:
+            return
+        
+        # Process each animation sequence
+        for i, par in enumerate(tn_lt.iter(_TAG_PAR)):
+            ctn = _XP_CTN(par)
+            if ctn is None:
+                continue
+                
+            # Get sequence ID and duration
+            seq_id = ctn.get('id', f'unknown_{i}')
+            dur = ctn.get('dur', 'unknown')
+            
+            # Find child animations
+            child_tn_lt = _XP_CHILDTNLST(ctn)
+            if child_tn_lt is None:
+                continue
+            
+            # Sequence-level properties shared by every effect below: node type
+            # (main sequence, trigger, etc.), repeat and auto-reverse
+            node_type = ctn.get('nodeType', 'mainSeq')
+            repeat_count = ctn.get('repeatCount', '1')
+            auto_reverse = ctn.get('autoRev', '0') == '1'
+                
+            # Process each animation effect
+            for j, child_par in enumerate(child_tn_lt.iter(_TAG_PAR)):
+                effect = _parse_effect(j, child_par)
+                if effect is None:
+                    continue
+                
+                (effect_id, shape_id, effect_type, effect_subtype, effect_direction,
+                 start_condition, delay_ms, duration_ms, build_level) = effect
+                
+                yield {
+                    'sequence_id': seq_id,
+                    'effect_id': effect_id,
+                    'shape_id': shape_id,
+                    'effect_type': effect_type,
+                    'effect_subtype': effect_subtype,
+                    'effect_direction': effect_direction,
+                    'start_condition': start_condition,
+                    'delay_ms': delay_ms,
+                    'duration_ms': duration_ms,
+                    'build_level': build_level,
+                    'node_type': node_type,
+                    'repeat_count': repeat_count,
+                    'auto_reverse': auto_reverse
+                }
+    
+    except Exception as e:
+        logger.error(f"Error extracting animation info: {e}", exc_info=True)
+
+# Natural-language phrases for effect subtypes, keyed by effect type
+_EFFECT_DESCRIPTIONS = {
+    'in': {
+        'fade': 'fades into view',
+        'fly': 'flies in',
+        'wipe': 'wipes in',
+        'zoom': 'zooms in',
+        'swivel': 'swivels in',
+        'bounce': 'bounces in',
+        'float': 'floats in',
+        'split': 'splits and enters',
+        'appear': 'appears instantly'
+    },
+    'out': {
+        'fade': 'fades out of view',
+        'fly': 'flies out',
+        'wipe': 'wipes out',
+        'zoom': 'zooms out',
+        'swivel': 'swivels out',
+        'bounce': 'bounces out',
+        'float': 'floats out',
+        'split': 'splits and exits',
+        'disappear': 'disappears instantly'
+    },
+    'emphasis': {
+        'color': 'changes color',
+        'grow/shrink': 'grows and shrinks',
+        'spin': 'spins',
+        'pulse': 'pulses',
+        'teeter': 'teeters',
+        'flash': 'flashes',
+        'shimmer': 'shimmers'
+    },
+    'motion': {
+        'path': 'follows a motion path',
+        'turn': 'turns',
+        'grow': 'grows in size',
+        'shrink': 'shrinks in size'
+    }
+}
+
+# Fallback verbs when an effect subtype has no specific phrase
+_EFFECT_VERBS = {
+    'in': 'enters the slide',
+    'out': 'exits the slide',
+    'emphasis': 'is emphasized',
+    'motion': 'moves'
+}
+
+# Phrases for effect directions
+_DIRECTION_PHRASES = {
+    'fromBottom': 'from the bottom',
+    'fromTop': 'from the top',
+    'fromLeft': 'from the left',
+    'fromRight': 'from the right',
+    'fromBottomLeft': 'from the bottom-left corner',
+    'fromBottomRight': 'from the bottom-right corner',
+    'fromTopLeft': 'from the top-left corner',
+    'fromTopRight': 'from the top-right corner',
+    'horizontal': 'horizontally',
+    'vertical': 'vertically',
+    'in': 'inward',
+    'out': 'outward'
+}
+
+# Phrases for animation start conditions
+_START_PHRASES = {
+    'on_click': "This animation starts when the presenter clicks",
+    'with_previous': "This animation plays simultaneously with the previous animation",
+    'after_previous': "This animation starts automatically after the previous animation completes"
+}
+
+def create_animation_description(animation, shape_info):
+    """
+    Create a comprehensive, human-readable description of an animation for LLM understanding.
+    
+    Args:
+        animation: Animation dictionary
+        shape_info: Dictionary of shape information
+        
+    Returns:
+        str: Detailed human-readable animation description
+    """
+    # Get detailed shape information
+    shape_id = animation['shape_id']
+    shape_details = shape_info.get(shape_id, {})
+    shape_type = shape_details.get('type', 'element').replace('_', ' ').lower()
+    shape_text = shape_details.get('text', '')
+    
+    # Create element description
+    element_desc = ""
+    if shape_text:
+        # Truncate very long text but keep it meaningful
+        display_text = shape_text[:100].strip()
+        if len(shape_text) > 100:
+            display_text += "..."
+        
+        if shape_type in ['text box', 'text placeholder', 'title']:
+            element_desc = f'The {shape_type} containing "{display_text}"'
+        elif shape_type == 'picture':
+            element_desc = f'An image/picture element'
+        else:
+            element_desc = f'A {shape_type} element with content "{display_text}"'
+    else:
+        if shape_type == 'picture':
+            element_desc = 'An image/picture element'
+        elif shape_type in ['auto shape', 'freeform']:
+            element_desc = 'A shape element'
+        else:
+            element_desc = f'A {shape_type} element'
+    
+    # Get the effect description
+    effect_type = animation.get('effect_type', 'appear')
+    effect_subtype = animation.get('effect_subtype', '')
+    
+    action = (_EFFECT_DESCRIPTIONS.get(effect_type, {}).get(effect_subtype)
+              or _EFFECT_VERBS.get(effect_type, 'animates'))
+    
+    # Collect description fragments and join them once at the end
+    parts = [element_desc, ' ', action]
+    
+    # Add direction details
+    direction = animation.get('effect_direction', '')
+    if direction:
+        direction_phrase = _DIRECTION_PHRASES.get(direction)
+        if direction_phrase:
+            parts.append(f" {direction_phrase}")
+        elif direction.startswith('to_color_'):
+            color = direction.replace('to_color_', '#')
+            parts.append(f" to the color {color}")
+        elif 'scale' in direction:
+            # Parse scale values
+            scale_match = re.search(r'scale_x(\d+)_y(\d+)', direction)
+            if scale_match:
+                x_scale = int(scale_match.group(1)) / 100000
+                y_scale = int(scale_match.group(2)) / 100000
+                parts.append(f" by {x_scale:.1f}x horizontally and {y_scale:.1f}x vertically")
+    
+    parts.append('.')
+    
+    # Build timing description
+    timing_desc = []
+    
+    # Start condition
+    start_phrase = _START_PHRASES.get(animation.get('start_condition', 'on_click'))
+    if start_phrase:
+        timing_desc.append(start_phrase)
+    
+    # Delay
+    delay = animation.get('delay_ms', 0)
+    if delay and delay > 0:
+        delay_sec = delay / 1000
+        if delay_sec >= 1:
+            timing_desc.append(f"with a {delay_sec:.1f} second delay")
+        else:
+            timing_desc.append(f"with a {int(delay)} millisecond delay")
+    
+    # Duration
+    duration = animation.get('duration_ms', 'unknown')
+    if duration != 'unknown' and duration != "unknown":
+        dur_sec = duration / 1000
+        if dur_sec >= 1:
+            timing_desc.append(f"taking {dur_sec:.1f} seconds to complete")
+        else:
+            timing_desc.append(f"taking {int(duration)} milliseconds to complete")
+    
+    # Repetition
+    repeat = animation.get('repeat_count', '1')
+    if repeat != '1':
+        if repeat == 'indefinite':
+            timing_desc.append("repeating continuously")
+        else:
+            timing_desc.append(f"repeating {repeat} times")
+    
+    # Auto-reverse
+    if animation.get('auto_reverse', False):
+        timing_desc.append("then reversing back to its original state")
+    
+    # Build level (for text animations)
+    build_level = animation.get('build_level', '')
+    if build_level:
+        # Parse paragraph range
+        para_match = re.search(r'paragraph_(\d+)-(\d+)', build_level)
+        if para_match:
+            start_para = int(para_match.group(1))
+            end_para = int(para_match.group(2))
+            if start_para == end_para:
+                timing_desc.append(f"animating paragraph {start_para + 1}")
+            else:
+                timing_desc.append(f"animating paragraphs {start_para + 1} through {end_para + 1}")
+    
+    # Combine all parts into a natural description
+    if timing_desc:
+        parts.append(' ')
+        parts.append('. '.join(timing_desc))
+        parts.append('.')
+    
+    # Add sequence information
+    seq_id = animation.get('sequence_id', '')
+    effect_id = animation.get('effect_id', '')
+    if seq_id and effect_id:
+        parts.append(f" (Animation sequence {seq_id}, effect {effect_id})")
+    
+    return ''.join(parts)
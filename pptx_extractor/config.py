@@ -2,13 +2,108 @@
 Configuration management for PowerPoint Context Extractor.
 """
 
-import json
+import copy
 import logging
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Prefer orjson, then ujson, for reading and writing the config file; fall back to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    try:
+        import ujson as json
+    except ImportError:
+        import json
 
 logger = logging.getLogger(__name__)
 
+# Timeout settings and their defaults, in the order calculate_timeout uses them
+_TIMEOUT_DEFAULTS = (
+    ('base_timeout_seconds', 60),
+    ('per_slide_basic_seconds', 5),
+    ('per_slide_recommendation_seconds', 20),
+    ('max_timeout_seconds', 600),
+)
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes with the fastest available library."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes with the fastest available library."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+@lru_cache(maxsize=8)
+def _resolve_config_path(config_path: Optional[str]) -> Path:
+    """
+    Resolve the configuration file path, probing the filesystem once per argument.
+    
+    Paths are made absolute, so a cached result still names the same file
+    after the working directory changes.
+    
+    Args:
+        config_path: Explicit path to the configuration file, or None to search
+        
+    Returns:
+        Path: Absolute configuration file path
+    """
+    if config_path:
+        return Path(config_path).resolve()
+    
+    # Look in several locations
+    possible_paths = [
+        Path("config.json"),  # Current directory
+        Path(__file__).parent.parent / "config.json",  # Project root
+        Path.home() / ".pptx_extractor" / "config.json",  # User home
+    ]
+    
+    for path in possible_paths:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return path.resolve()
+    
+    # Default to project root
+    return (Path(__file__).parent.parent / "config.json").resolve()
+
+def _flatten(config: Dict[str, Any], prefix: str = '', flat: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Index every value in a nested configuration by its dotted path.
+    
+    Intermediate sections are indexed too, so 'timeouts' maps to the whole
+    timeouts dictionary as well as 'timeouts.base_timeout_seconds' to its value.
+    
+    Args:
+        config: Nested configuration dictionary
+        prefix: Dotted path of config within the root configuration
+        flat: Index to add entries to (created if omitted)
+        
+    Returns:
+        Dict[str, Any]: Mapping of dotted paths to values
+    """
+    if flat is None:
+        flat = {}
+    for key, value in config.items():
+        # Keys containing dots cannot be addressed with dot notation
+        if '.' in key:
+            continue
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", flat)
+    return flat
+
 class Config:
     """Configuration manager for the PowerPoint Context Extractor."""
     
@@ -20,41 +115,29 @@ class Config:
             config_path: Path to configuration file. If None, uses default location.
         """
         self._config = {}
+        self._flat = {}
+        self._timeouts = None
         self._config_path = self._find_config_path(config_path)
         self._load_config()
     
     def _find_config_path(self, config_path: Optional[str]) -> Path:
         """Find the configuration file path."""
-        if config_path:
-            return Path(config_path)
-        
-        # Look in several locations
-        possible_paths = [
-            Path("config.json"),  # Current directory
-            Path(__file__).parent.parent / "config.json",  # Project root
-            Path.home() / ".pptx_extractor" / "config.json",  # User home
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                return path
-        
-        # Default to project root
-        return Path(__file__).parent.parent / "config.json"
+        return _resolve_config_path(config_path)
     
     def _load_config(self):
         """Load configuration from file."""
+        self._timeouts = None
         try:
-            if self._config_path.exists():
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
-                logger.info(f"Loaded configuration from {self._config_path}")
-            else:
-                logger.warning(f"Configuration file not found at {self._config_path}, using defaults")
-                self._config = self._get_default_config()
+            with open(self._config_path, 'rb') as f:
+                self._config = _json_loads(f.read())
+            logger.info(f"Loaded configuration from {self._config_path}")
+        except FileNotFoundError:
+            logger.warning(f"Configuration file not found at {self._config_path}, using defaults")
+            self._config = self._get_default_config()
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             self._config = self._get_default_config()
+        self._flat = _flatten(self._config)
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration when file is not available."""
@@ -90,6 +173,9 @@ class Config:
         """
         Get configuration value using dot notation.
         
+        Sections and lists are returned as copies, so changing them does not
+        change the configuration; use set() for that.
+        
         Args:
             key_path: Dot-separated path to the configuration value (e.g., 'api_settings.anthropic.model')
             default: Default value if key is not found
@@ -97,15 +183,13 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
-        value = self._config
-        
         try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
+            value = self._flat[key_path]
+        except KeyError:
             return default
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
     
     def set(self, key_path: str, value: Any):
         """
@@ -115,6 +199,7 @@ class Config:
             key_path: Dot-separated path to the configuration value
             value: Value to set
         """
+        self._timeouts = None
         keys = key_path.split('.')
         config = self._config
         
@@ -126,6 +211,9 @@ class Config:
         
         # Set the final value
         config[keys[-1]] = value
+        
+        # Rebuild the dotted-path index from the nested form
+        self._flat = _flatten(self._config)
     
     def save(self, config_path: Optional[str] = None):
         """
@@ -140,8 +228,8 @@ class Config:
             # Ensure directory exists
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2)
+            with open(save_path, 'wb') as f:
+                f.write(_json_dumps(self._config))
             
             logger.info(f"Configuration saved to {save_path}")
         except Exception as e:
@@ -174,12 +262,7 @@ class Config:
         Returns:
             Timeout in seconds
         """
-        timeout_config = self.get_timeout_config()
-        
-        base_timeout = timeout_config.get('base_timeout_seconds', 60)
-        per_slide_basic = timeout_config.get('per_slide_basic_seconds', 5)
-        per_slide_rec = timeout_config.get('per_slide_recommendation_seconds', 20)
-        max_timeout = timeout_config.get('max_timeout_seconds', 600)
+        base_timeout, per_slide_basic, per_slide_rec, max_timeout = self._get_timeouts()
         
         per_slide_time = per_slide_basic
         if has_recommendations:
@@ -187,10 +270,23 @@ class Config:
         
         total_timeout = base_timeout + (num_slides * per_slide_time)
         return min(total_timeout, max_timeout)
+    
+    def _get_timeouts(self) -> Tuple[int, int, int, int]:
+        """
+        Get the timeout settings, resolved once per configuration state.
+        
+        Returns:
+            Tuple of (base, per-slide basic, per-slide recommendation, maximum) seconds
+        """
+        if self._timeouts is None:
+            timeout_config = self.get_timeout_config()
+            self._timeouts = tuple(timeout_config.get(key, default) for key, default in _TIMEOUT_DEFAULTS)
+        return self._timeouts
 
 
-# Global configuration instance
-_config_instance = None
+# Global configuration instance, created on first use
+_config_instance: Optional[Config] = None
+_config_lock = threading.Lock()
 
 def get_config(config_path: Optional[str] = None) -> Config:
     """
@@ -204,10 +300,15 @@ def get_config(config_path: Optional[str] = None) -> Config:
     """
     global _config_instance
     
-    if _config_instance is None:
-        _config_instance = Config(config_path)
+    # Fast path: no locking once the instance exists
+    instance = _config_instance
+    if instance is not None:
+        return instance
     
-    return _config_instance
+    with _config_lock:
+        if _config_instance is None:
+            _config_instance = Config(config_path)
+        return _config_instance
 
 def reload_config(config_path: Optional[str] = None):
     """
@@ -217,4 +318,6 @@ def reload_config(config_path: Optional[str] = None):
         config_path: Path to configuration file
     """
     global _config_instance
-    _config_instance = Config(config_path)
\ No newline at end of file
+    config = Config(config_path)
+    with _config_lock:
+        _config_instance = config
\ No newline at end of file
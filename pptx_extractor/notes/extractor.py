@@ -4,18 +4,172 @@ Notes extraction functionality for PowerPoint presentations.
 
 import re
 import zipfile
-import xml.etree.ElementTree as ET
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pptx import Presentation
+# python-pptx depends on lxml, so its compiled XPath lookups are always available
+from lxml import etree
 
-from ..utils.common import NAMESPACES, register_namespaces, get_slide_text_as_markdown
+from ..utils.common import (ET, LXML_AVAILABLE, NAMESPACES, TAG_A_P, TAG_A_R, TAG_A_T, TAG_P_SP,
+                            register_namespaces, get_slide_text_as_markdown)
 
 logger = logging.getLogger(__name__)
 
+# Notes slide part names, e.g. 'ppt/notesSlides/notesSlide3.xml'
+_NOTES_RE = re.compile(r'ppt/notesSlides/notesSlide(\d+)\.xml$')
+
+# Shape elements are handled one at a time while streaming a notes slide
+_TAG_SP = TAG_P_SP
+_TAG_P = TAG_A_P
+_TAG_R = TAG_A_R
+_TAG_T = TAG_A_T
+
+# Size of the chunks read from a notes slide part and fed to the parser
+_FEED_SIZE = 64 * 1024
+
+# Upper bound on threads used to parse notes slides
+_MAX_NOTES_WORKERS = 8
+
+def _compile_findall(path):
+    """
+    Compile a namespaced element path once for repeated lookups.
+    
+    Args:
+        path: Prefixed element path relative to the context element (e.g. './/a:p')
+        
+    Returns:
+        callable: Function taking an element and returning a list of matches
+    """
+    return etree.XPath(path, namespaces=NAMESPACES)
+
+_BODY_PH_XP = _compile_findall('.//p:nvPr/p:ph[@type="body"]')
+_TXBODY_XP = _compile_findall('.//p:txBody')
+
+def _new_notes_parser():
+    """
+    Create a pull parser that reports completed elements of a notes slide.
+    
+    Returns:
+        XMLPullParser: Parser emitting 'end' events (only for <p:sp> under lxml)
+    """
+    if LXML_AVAILABLE:
+        return ET.XMLPullParser(events=('end',), tag=_TAG_SP, huge_tree=False, collect_ids=False)
+    return ET.XMLPullParser(events=('end',))
+
+def _paragraph_text(p):
+    """
+    Join the non-blank text of a paragraph's runs, or of all its text elements if it has no runs.
+    
+    Args:
+        p: An <a:p> element
+        
+    Returns:
+        str: Text pieces joined by spaces
+    """
+    runs = list(p.iter(_TAG_R))
+    if runs:
+        texts = (t.text for r in runs for t in r.iter(_TAG_T))
+    else:
+        texts = (t.text for t in p.iter(_TAG_T))
+    return ' '.join(text for text in texts if text and text.strip())
+
+def _shape_notes_text(shape):
+    """
+    Get the notes text from a shape if it is the notes body placeholder.
+    
+    Args:
+        shape: A complete <p:sp> element from a notes slide
+        
+    Returns:
+        str: The placeholder's paragraphs joined by newlines, or an empty string
+    """
+    # Check if this is the notes placeholder (has placeholder type="body")
+    if not _BODY_PH_XP(shape):
+        return ""
+    
+    tx_bodies = _TXBODY_XP(shape)
+    if not tx_bodies:
+        return ""
+    tx_body = tx_bodies[0]
+    
+    # Combine the non-empty paragraphs into notes text
+    return '\n'.join(filter(None, (_paragraph_text(p) for p in tx_body.iter(_TAG_P))))
+
+def _find_notes_text(chunks):
+    """
+    Stream a notes slide and return the text of its body placeholder.
+    
+    Shapes are examined one at a time as the parser completes them and are
+    cleared afterwards, so the notes slide is never held as a full tree, and
+    parsing stops at the first body placeholder that has text.
+    
+    Args:
+        chunks: Iterable of notes slide XML fragments, in order
+        
+    Returns:
+        str: Notes text, or an empty string if none was found
+    """
+    parser = _new_notes_parser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag != _TAG_SP:
+                continue
+            notes_text = _shape_notes_text(elem)
+            elem.clear()
+            if notes_text:
+                return notes_text
+    
+    parser.close()
+    return ""
+
+def _extract_notes_batch(pptx_path, notes_files):
+    """
+    Extract notes text from a batch of notes slide parts.
+    
+    Each batch opens its own handle on the archive, so batches can be
+    processed on separate threads.
+    
+    Args:
+        pptx_path (str): Path to the PowerPoint file
+        notes_files (list): (part name, slide number) pairs to process
+        
+    Returns:
+        dict: Dictionary mapping slide numbers to notes text
+    """
+    notes_by_slide = {}
+    
+    with zipfile.ZipFile(pptx_path) as pptx_zip:
+        for notes_file, slide_num in notes_files:
+            try:
+                # Extract notes text from XML
+                with pptx_zip.open(notes_file) as notes_xml:
+                    logger.debug(f"Processing notes file: {notes_file}")
+                    
+                    # Feed the parser raw bytes straight from the archive; it decodes
+                    # according to the XML declaration
+                    chunks = iter(lambda: notes_xml.read(_FEED_SIZE), b'')
+                    notes_text = _find_notes_text(chunks)
+                    
+                    if notes_text:
+                        notes_by_slide[slide_num] = notes_text
+                        logger.debug(f"Found notes for slide {slide_num}: {notes_text[:50]}..." if len(notes_text) > 50 else f"Found notes for slide {slide_num}: {notes_text}")
+                    else:
+                        # Log if no notes content was found
+                        logger.debug(f"No notes content found in {notes_file}")
+            
+            except Exception as e:
+                logger.error(f"Error processing notes file {notes_file}: {e}", exc_info=True)
+    
+    return notes_by_slide
+
 def extract_notes_from_xml(pptx_path, slide_filter=None):
     """
     Extract notes directly from the PPTX XML structure.
     
+    Notes slides are independent of each other, so they are split into
+    batches that are parsed on a small thread pool.
+    
     Args:
         pptx_path (str): Path to the PowerPoint file
         slide_filter (set): Optional set of slide numbers to process
@@ -27,90 +181,35 @@ def extract_notes_from_xml(pptx_path, slide_filter=None):
     
     try:
         with zipfile.ZipFile(pptx_path) as pptx_zip:
-            # Get list of all notes files
-            notes_files = [f for f in pptx_zip.namelist() if f.startswith('ppt/notesSlides/notesSlide') and f.endswith('.xml')]
-            
-            if not notes_files:
-                logger.info("No notes files found in the PowerPoint file.")
-                return notes_by_slide
-            
-            logger.info(f"Found {len(notes_files)} notes files in the PowerPoint file.")
-            
-            # Process each notes file
-            for notes_file in notes_files:
-                try:
-                    # Extract slide number from notes file name
-                    import re
-                    match = re.search(r'notesSlide(\d+)\.xml', notes_file)
-                    if not match:
-                        continue
-                    slide_num = int(match.group(1))
-                    
-                    # Skip if slide filtering is enabled and this slide is not in the filter
-                    if slide_filter and slide_num not in slide_filter:
-                        continue
-                    
-                    # Extract notes text from XML
-                    with pptx_zip.open(notes_file) as notes_xml:
-                        xml_content = notes_xml.read().decode('utf-8')
-                        logger.debug(f"Processing notes file: {notes_file}")
-                        
-                        # Parse XML content
-                        root = ET.fromstring(xml_content)
-                        
-                        # Find all shapes in the notes slide
-                        shapes = root.findall('.//p:sp', NAMESPACES)
-                        
-                        # Look for the shape with the notes content (has placeholder type="body")
-                        notes_text = ""
-                        for shape in shapes:
-                            # Check if this is the notes placeholder
-                            ph_elem = shape.find('.//p:nvPr/p:ph[@type="body"]', NAMESPACES)
-                            if ph_elem is not None:
-                                # This is the notes placeholder, extract text
-                                tx_body = shape.find('.//p:txBody', NAMESPACES)
-                                if tx_body is not None:
-                                    # Extract all paragraphs
-                                    paragraphs = []
-                                    
-                                    # Find all paragraph elements
-                                    p_elems = tx_body.findall('.//a:p', NAMESPACES)
-                                    for p in p_elems:
-                                        # Find all text runs in this paragraph
-                                        r_elems = p.findall('.//a:r', NAMESPACES)
-                                        para_text = []
-                                        
-                                        # If there are no text runs, check for direct text elements
-                                        if not r_elems:
-                                            t_elems = p.findall('.//a:t', NAMESPACES)
-                                            for t in t_elems:
-                                                if t.text and t.text.strip():
-                                                    para_text.append(t.text)
-                                        else:
-                                            # Extract text from each run
-                                            for r in r_elems:
-                                                t_elems = r.findall('.//a:t', NAMESPACES)
-                                                for t in t_elems:
-                                                    if t.text and t.text.strip():
-                                                        para_text.append(t.text)
-                                        
-                                        # Add paragraph text if not empty
-                                        if para_text:
-                                            paragraphs.append(' '.join(para_text))
-                                    
-                                    # Combine paragraphs into notes text
-                                    if paragraphs:
-                                        notes_text = '\n'.join(paragraphs)
-                                        notes_by_slide[slide_num] = notes_text
-                                        logger.debug(f"Found notes for slide {slide_num}: {notes_text[:50]}..." if len(notes_text) > 50 else f"Found notes for slide {slide_num}: {notes_text}")
-                                        break  # Found the notes, no need to check other shapes
-                        
-                        # Log if no notes content was found
-                        if slide_num not in notes_by_slide:
-                            logger.debug(f"No notes content found in {notes_file}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing notes file {notes_file}: {e}", exc_info=True)
+            # Collect the notes files to process, with their numbers, in one pass over
+            # the archive's member list, skipping slides excluded by the filter
+            notes_files = []
+            notes_count = 0
+            for info in pptx_zip.infolist():
+                match = _NOTES_RE.match(info.filename)
+                if not match:
+                    continue
+                notes_count += 1
+                slide_num = int(match.group(1))
+                if slide_filter and slide_num not in slide_filter:
+                    continue
+                notes_files.append((info.filename, slide_num))
+        
+        if not notes_count:
+            logger.info("No notes files found in the PowerPoint file.")
+            return notes_by_slide
+        
+        logger.info(f"Found {notes_count} notes files in the PowerPoint file.")
+        
+        # Process the notes files, spread across threads when there is more than one
+        workers = min(_MAX_NOTES_WORKERS, len(notes_files))
+        if workers <= 1:
+            notes_by_slide.update(_extract_notes_batch(pptx_path, notes_files))
+        else:
+            batches = [notes_files[k::workers] for k in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch_notes in executor.map(_extract_notes_batch, [pptx_path] * workers, batches):
+                    notes_by_slide.update(batch_notes)
     
     except Exception as e:
         logger.error(f"Error extracting notes from XML: {e}", exc_info=True)
@@ -153,25 +252,22 @@ def extract_slide_notes(pptx_path, slide_filter=None):
         if slide_filter and i not in slide_filter:
             continue
             
-        # Get slide title
+        # Get slide title from the first shape with text, reading each shape's text once
         title = "Untitled"
         for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.has_text_frame:
-                if shape.text.strip():
-                    title = shape.text.strip().replace('\n', ' ')
-                    break
+            if not getattr(shape, 'has_text_frame', False):
+                continue
+            text = shape.text_frame.text.strip()
+            if text:
+                title = text.replace('\n', ' ')
+                break
         
-        # Extract notes text using python-pptx
-        pptx_notes = ""
-        if hasattr(slide, 'has_notes_slide') and slide.has_notes_slide:
+        # Use the notes from XML parsing when it found any; only fall back to
+        # python-pptx, which loads the notes slide part, when it did not
+        notes_text = xml_notes.get(i, "")
+        if not notes_text and hasattr(slide, 'has_notes_slide') and slide.has_notes_slide:
             if hasattr(slide.notes_slide, 'notes_text_frame'):
-                pptx_notes = slide.notes_slide.notes_text_frame.text.strip()
-        
-        # Get notes from XML parsing
-        xml_note = xml_notes.get(i, "")
-        
-        # Use the best available notes (prefer XML parsing if it found notes)
-        notes_text = xml_note if xml_note else pptx_notes
+                notes_text = slide.notes_slide.notes_text_frame.text.strip()
         
         # Extract slide text content as Markdown
         slide_text = get_slide_text_as_markdown(slide)
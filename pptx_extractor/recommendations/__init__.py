@@ -3,13 +3,17 @@ Recommendations module for generating AI-powered slide usage recommendations.
 """
 
 from .generator import (
+    Slide,
     generate_recommendation,
     generate_all_recommendations,
     get_slide_context
 )
+from .cache import SemanticCache
 
 __all__ = [
+    'Slide',
     'generate_recommendation',
     'generate_all_recommendations',
-    'get_slide_context'
+    'get_slide_context',
+    'SemanticCache'
 ]
\ No newline at end of file
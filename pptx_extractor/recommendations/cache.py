@@ -0,0 +1,191 @@
+"""
+Persistent cache for LLM recommendations.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import time
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+# Semantic matching needs sentence-transformers; exact matching works without it
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default location of the cache database
+DEFAULT_CACHE_PATH = Path.home() / '.pptx_extractor' / 'llm_cache.sqlite'
+
+# Embedding model used for semantic matching
+_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    embedding BLOB,
+    response TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope);
+"""
+
+def _md5(text: str) -> str:
+    """Get the hex MD5 digest of a string."""
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+@lru_cache(maxsize=1)
+def _get_embedding_model():
+    """
+    Load the sentence embedding model on first use.
+    
+    Returns:
+        SentenceTransformer: Embedding model
+    """
+    return SentenceTransformer(_EMBEDDING_MODEL)
+
+def _embed(text: str) -> array:
+    """
+    Embed text as a unit-length vector.
+    
+    Args:
+        text: Text to embed
+    
+    Returns:
+        array: Normalized embedding as 32-bit floats
+    """
+    vector = _get_embedding_model().encode(text, normalize_embeddings=True)
+    return array('f', (float(x) for x in vector))
+
+class SemanticCache:
+    """
+    SQLite-backed cache of LLM responses with exact and optional semantic lookup.
+    
+    Entries are grouped by a scope (e.g. provider, model and prompt template)
+    so responses are only reused for requests that would be sent the same way.
+    Within a scope, a lookup first matches the exact text; if semantic matching
+    is enabled, it then falls back to the stored text whose embedding is most
+    similar, provided the cosine similarity reaches the threshold.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: Optional[float] = 30 * 24 * 3600,
+                 semantic: bool = False, similarity_threshold: float = 0.9):
+        """
+        Open (creating if needed) a cache database.
+        
+        Args:
+            path: Path to the SQLite database (default: ~/.pptx_extractor/llm_cache.sqlite)
+            ttl_seconds: Age after which entries are ignored, or None to keep them forever
+            semantic: Whether to match similar, not just identical, text
+            similarity_threshold: Minimum cosine similarity for a semantic match
+        """
+        self._path = Path(path) if path else DEFAULT_CACHE_PATH
+        self._ttl_seconds = ttl_seconds
+        self._similarity_threshold = similarity_threshold
+        self._semantic = semantic and SENTENCE_TRANSFORMERS_AVAILABLE
+        if semantic and not SENTENCE_TRANSFORMERS_AVAILABLE:
+            logger.warning("sentence-transformers not installed; semantic cache matching disabled. "
+                           "Install with: pip install sentence-transformers")
+        
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open recommendation cache {self._path}: {e}")
+            self._conn = None
+    
+    def _min_created(self) -> float:
+        """Get the creation time before which entries have expired."""
+        if self._ttl_seconds is None:
+            return 0.0
+        return time.time() - self._ttl_seconds
+    
+    def get(self, scope: str, text: str) -> Optional[str]:
+        """
+        Look up the response cached for a text.
+        
+        Args:
+            scope: Scope the response must have been stored under
+            text: Text the response was generated for
+        
+        Returns:
+            Optional[str]: Cached response, or None on a miss
+        """
+        if self._conn is None:
+            return None
+        
+        scope_key = _md5(scope)
+        min_created = self._min_created()
+        try:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                (_md5(f"{scope_key}\n{text}"), min_created)).fetchone()
+            if row is not None:
+                return row[0]
+            
+            if not self._semantic:
+                return None
+            
+            rows = self._conn.execute(
+                "SELECT embedding, response FROM responses "
+                "WHERE scope = ? AND embedding IS NOT NULL AND created >= ?",
+                (scope_key, min_created)).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading recommendation cache: {e}")
+            return None
+        
+        if not rows:
+            return None
+        
+        # Embeddings are unit length, so the dot product is the cosine similarity
+        query = _embed(text)
+        best_response = None
+        best_similarity = self._similarity_threshold
+        for blob, response in rows:
+            stored = array('f')
+            stored.frombytes(blob)
+            similarity = sum(a * b for a, b in zip(query, stored))
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best_response = response
+        
+        if best_response is not None:
+            logger.debug(f"Semantic cache hit (similarity {best_similarity:.3f})")
+        return best_response
+    
+    def set(self, scope: str, text: str, response: str):
+        """
+        Store the response generated for a text.
+        
+        Args:
+            scope: Scope to store the response under
+            text: Text the response was generated for
+            response: Generated response
+        """
+        if self._conn is None:
+            return
+        
+        scope_key = _md5(scope)
+        embedding = _embed(text).tobytes() if self._semantic else None
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, scope, embedding, response, created) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (_md5(f"{scope_key}\n{text}"), scope_key, embedding, response, time.time()))
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing recommendation cache: {e}")
+    
+    def close(self):
+        """Close the cache database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
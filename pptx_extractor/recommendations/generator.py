@@ -3,21 +3,24 @@ Slide usage recommendations using LLM analysis.
 """
 
 import os
+import asyncio
+import io
 import logging
 import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from ..config import get_config
+from .cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
-# Try to import Anthropic client
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    logger.warning("Anthropic library not installed. Install with: pip install anthropic")
+# The Anthropic SDK is slow to import, so it is only imported once recommendations are
+# generated; None until then
+ANTHROPIC_AVAILABLE = None
 
 # Try to import Google Generative AI client
 try:
@@ -27,52 +30,675 @@ except ImportError:
     GOOGLE_AVAILABLE = False
     logger.warning("Google Generative AI library not installed. Install with: pip install google-generativeai")
 
-def get_slide_context(slide_data: Dict) -> str:
+# Embedded prompt used when system_message.md cannot be read; {context} is filled per slide
+_PROMPT_TEMPLATE = """You are a presentation expert analyzing PowerPoint slides. Based on the following slide information, write a single paragraph (3-5 sentences) describing when and how a presenter would want to use this slide. Focus on the practical purpose and ideal usage scenarios.
+
+{context}
+
+Provide a recommendation that:
+1. Identifies the slide's primary purpose
+2. Suggests when in a presentation it would be most effective
+3. Describes what type of content or message it's designed to convey
+4. Mentions any special features (animations, layout) that enhance its effectiveness
+
+Write in a professional, helpful tone as if advising a presenter preparing their talk."""
+
+# Maximum number of recommendation requests in flight at once
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Idle connections each shared HTTP client keeps open for reuse
+_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Longest edge, in pixels, of slide images sent to Claude; larger images are downscaled by the API anyway
+_MAX_IMAGE_EDGE = 1568
+
+# JPEG quality for slide images sent to Claude
+_JPEG_QUALITY = 85
+
+# HTTP statuses worth retrying: timed out, rate limited, overloaded or temporarily unavailable
+_TRANSIENT_STATUSES = frozenset((408, 429, 500, 502, 503, 504, 529))
+
+# Bounds, in seconds, of the randomized exponential backoff between retries
+_RETRY_MIN_SECONDS = 1
+_RETRY_MAX_SECONDS = 30
+
+# Consecutive failed requests after which a provider is not called for a cooldown period
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 60
+
+# Decks smaller than this are not worth the latency of a Message Batches request
+_MIN_BATCH_SIZE = 5
+
+# Seconds between checks on a Message Batches request
+_BATCH_POLL_SECONDS = 10
+
+# Default seconds to wait for a Message Batches request before cancelling it
+_BATCH_TIMEOUT_SECONDS = 3600
+
+# Recommendations for slides with no content at all, which are not worth an API call
+_OPENING_SLIDE_RECOMMENDATION = ("Likely the title slide; use it to open the presentation, introduce the topic "
+                                 "and speaker, and set expectations before moving into the content.")
+_CLOSING_SLIDE_RECOMMENDATION = ("Likely a closing slide; use it to wrap up the presentation, restate the key "
+                                 "takeaway, and transition into questions or next steps.")
+_DIVIDER_SLIDE_RECOMMENDATION = ("Likely a section divider; use it as a visual break to signal a change of topic, "
+                                 "give the audience a moment to reset, and preview what the next section covers.")
+
+class Slide:
+    """The slide fields used to generate a recommendation."""
+    
+    __slots__ = ('number', 'title', 'notes', 'animation_summary', 'animation_details',
+                 'image_path', 'recommended_usage', 'text', 'animation_sequence')
+    
+    def __init__(self, number, title: str = "", notes: str = "", animation_summary: str = "",
+                 animation_details: Optional[List[Dict]] = None, image_path: Optional[str] = None,
+                 recommended_usage: str = "", text: str = "",
+                 animation_sequence: Optional[List[Dict]] = None):
+        """
+        Initialize a slide.
+        
+        Args:
+            number: Slide number
+            title: Slide title
+            notes: Speaker notes
+            animation_summary: Summary of the slide's animations
+            animation_details: Animation dictionaries, each with a 'description'
+            image_path: Path to the slide image, if one was extracted
+            recommended_usage: Generated recommendation
+            text: Body text of the slide
+            animation_sequence: Animation dictionaries as written by the CLI
+        """
+        self.number = number
+        self.title = title
+        self.notes = notes
+        self.animation_summary = animation_summary
+        self.animation_details = animation_details if animation_details is not None else []
+        self.image_path = image_path
+        self.recommended_usage = recommended_usage
+        self.text = text or ""
+        self.animation_sequence = animation_sequence if animation_sequence is not None else []
+    
+    @classmethod
+    def from_dict(cls, slide_data: Dict) -> 'Slide':
+        """
+        Create a slide from a slide dictionary.
+        
+        Args:
+            slide_data: Dictionary containing slide information
+            
+        Returns:
+            Slide: Slide with the dictionary's fields
+        """
+        return cls(
+            slide_data.get('number', 'Unknown'),
+            slide_data.get('title', ''),
+            slide_data.get('notes', ''),
+            slide_data.get('animation_summary', ''),
+            slide_data.get('animation_details', []),
+            slide_data.get('image_path'),
+            slide_data.get('recommended_usage', ''),
+            slide_data.get('text', ''),
+            slide_data.get('animation_sequence', []),
+        )
+
+def _as_slide(slide_data: Union[Slide, Dict]) -> Slide:
+    """
+    Get slide data as a Slide, converting a slide dictionary if needed.
+    
+    Args:
+        slide_data: Slide or dictionary containing slide information
+        
+    Returns:
+        Slide: The slide
+    """
+    if isinstance(slide_data, Slide):
+        return slide_data
+    return Slide.from_dict(slide_data)
+
+@lru_cache(maxsize=1)
+def _lazy_anthropic():
+    """
+    Import the Anthropic SDK on first use.
+    
+    Returns:
+        module: The anthropic module, or None if it is not installed
+    """
+    global ANTHROPIC_AVAILABLE
+    try:
+        import anthropic
+    except ImportError:
+        ANTHROPIC_AVAILABLE = False
+        logger.warning("Anthropic library not installed. Install with: pip install anthropic")
+        return None
+    ANTHROPIC_AVAILABLE = True
+    return anthropic
+
+def _http_client_options(async_client: bool = False) -> Dict:
+    """
+    Get Anthropic client options for an HTTP client that keeps connections alive.
+    
+    HTTP/2 is used when the h2 package is installed, so concurrent requests
+    share one connection.
+    
+    Args:
+        async_client: Whether the options are for an AsyncAnthropic client
+        
+    Returns:
+        Dict: Keyword arguments for the client constructor (empty if httpx is unavailable)
+    """
+    try:
+        import httpx
+    except ImportError:
+        return {}
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    client_class = httpx.AsyncClient if async_client else httpx.Client
+    limits = httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS)
+    return {'http_client': client_class(http2=http2, limits=limits)}
+
+class _CircuitBreaker:
+    """Fail fast for a while once a provider has failed repeatedly."""
+    
+    def __init__(self, provider: str, threshold: int = _BREAKER_THRESHOLD,
+                 cooldown_seconds: float = _BREAKER_COOLDOWN_SECONDS):
+        """
+        Initialize a closed circuit breaker.
+        
+        Args:
+            provider: Provider name, for messages
+            threshold: Consecutive failures that open the breaker
+            cooldown_seconds: How long the breaker stays open
+        """
+        self.provider = provider
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._failures = 0
+        self._open_until = 0.0
+    
+    def check(self):
+        """
+        Raise if the breaker is open.
+        
+        Raises:
+            RuntimeError: If requests to the provider are currently suspended
+        """
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise RuntimeError(f"{self.provider} requests suspended for {remaining:.0f}s after repeated failures")
+    
+    def record_success(self):
+        """Record a successful request."""
+        self._failures = 0
+    
+    def record_failure(self):
+        """Record a failed request, opening the breaker once the threshold is reached."""
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._failures = 0
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(f"{self.threshold} consecutive {self.provider} requests failed; "
+                           f"suspending requests for {self.cooldown_seconds}s")
+
+_BREAKERS = {
+    'anthropic': _CircuitBreaker('anthropic'),
+    'google': _CircuitBreaker('google'),
+}
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+    
+    Args:
+        error: Exception raised by the provider SDK
+        
+    Returns:
+        bool: True for rate limiting, overload, server errors, timeouts and connection failures
+    """
+    # Anthropic errors carry status_code; Google API errors carry the HTTP status as code
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(error, 'code', None)
+    if isinstance(status, int):
+        return status in _TRANSIENT_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError)) or type(error).__name__ in (
+        'APIConnectionError', 'APITimeoutError')
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Get how long to wait before retrying a request.
+    
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        error: Exception raised by the attempt
+        
+    Returns:
+        float: Seconds to wait; the server's retry-after if given, else randomized exponential backoff
+    """
+    response = getattr(error, 'response', None)
+    retry_after = getattr(response, 'headers', {}).get('retry-after') if response is not None else None
+    try:
+        return min(float(retry_after), _RETRY_MAX_SECONDS)
+    except (TypeError, ValueError):
+        pass
+    return max(_RETRY_MIN_SECONDS, random.uniform(0, min(_RETRY_MAX_SECONDS, _RETRY_MIN_SECONDS * 2 ** attempt)))
+
+def _retry_attempts() -> int:
+    """Get the number of times a transiently failed request is retried."""
+    return get_config().get('error_handling.retry_attempts', 4)
+
+def _call_with_retries(provider: str, call):
+    """
+    Make a provider request, retrying transient failures with backoff.
+    
+    Only transient failures that outlast the retries count toward the
+    provider's circuit breaker; other errors are raised straight away.
+    
+    Args:
+        provider: Provider name ("anthropic" or "google")
+        call: Function making the request
+        
+    Returns:
+        The result of call
+        
+    Raises:
+        RuntimeError: If the provider's circuit breaker is open
+        Exception: The last error, if the request did not succeed
+    """
+    breaker = _BREAKERS[provider]
+    breaker.check()
+    retries = _retry_attempts()
+    for attempt in range(retries + 1):
+        try:
+            result = call()
+        except Exception as e:
+            if attempt < retries and _is_transient(e):
+                delay = _retry_delay(attempt, e)
+                logger.warning(f"{provider} request failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            # Only provider trouble counts toward the breaker; a bad request says nothing about the provider
+            if _is_transient(e):
+                breaker.record_failure()
+            raise
+        breaker.record_success()
+        return result
+
+async def _call_with_retries_async(provider: str, call):
+    """
+    Make a provider request without blocking the event loop, retrying transient failures with backoff.
+    
+    Args:
+        provider: Provider name ("anthropic" or "google")
+        call: Function returning an awaitable that makes the request
+        
+    Returns:
+        The awaited result of call
+        
+    Raises:
+        RuntimeError: If the provider's circuit breaker is open
+        Exception: The last error, if the request did not succeed
+    """
+    breaker = _BREAKERS[provider]
+    breaker.check()
+    retries = _retry_attempts()
+    for attempt in range(retries + 1):
+        try:
+            result = await call()
+        except Exception as e:
+            if attempt < retries and _is_transient(e):
+                delay = _retry_delay(attempt, e)
+                logger.warning(f"{provider} request failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            # Only provider trouble counts toward the breaker; a bad request says nothing about the provider
+            if _is_transient(e):
+                breaker.record_failure()
+            raise
+        breaker.record_success()
+        return result
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """
+    Get a shared Anthropic client for an API key.
+    
+    Reusing the client keeps its HTTP connection pool warm across slides.
+    Retries are handled by _call_with_retries, so the SDK's own are disabled.
+    
+    Args:
+        api_key: API key for Anthropic
+        
+    Returns:
+        Anthropic: Client instance
+    """
+    return _lazy_anthropic().Anthropic(api_key=api_key, max_retries=0, **_http_client_options())
+
+@lru_cache(maxsize=4)
+def _get_google_model(api_key: str, model_name: str):
+    """
+    Get a shared Gemini model for an API key.
+    
+    Reusing the model keeps its channel to the API open across slides.
+    
+    Args:
+        api_key: API key for Google
+        model_name: Model name
+        
+    Returns:
+        GenerativeModel: Model instance
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+def _first_paragraph(text: str) -> Optional[str]:
+    """
+    Get the first paragraph of a partial response once it is complete.
+    
+    A paragraph is complete when a blank line follows a finished sentence, so
+    a heading on its own line does not count as the whole response.
+    
+    Args:
+        text: Response text received so far
+        
+    Returns:
+        Optional[str]: Text up to the end of the first complete paragraph, or None
+    """
+    text = text.lstrip()
+    end = text.find("\n\n")
+    while end != -1:
+        paragraph = text[:end].rstrip()
+        if paragraph.endswith(('.', '!', '?')):
+            return paragraph
+        end = text.find("\n\n", end + 2)
+    return None
+
+def _read_first_paragraph(texts) -> str:
+    """
+    Read streamed response text until the first paragraph is complete.
+    
+    Args:
+        texts: Iterable of response text fragments
+        
+    Returns:
+        str: First paragraph, or the whole response if it never completes one
+    """
+    text = ""
+    for piece in texts:
+        text += piece
+        paragraph = _first_paragraph(text)
+        if paragraph is not None:
+            return paragraph
+    return text.strip()
+
+async def _read_first_paragraph_async(texts) -> str:
+    """
+    Read streamed response text until the first paragraph is complete.
+    
+    Args:
+        texts: Async iterable of response text fragments
+        
+    Returns:
+        str: First paragraph, or the whole response if it never completes one
+    """
+    text = ""
+    async for piece in texts:
+        text += piece
+        paragraph = _first_paragraph(text)
+        if paragraph is not None:
+            return paragraph
+    return text.strip()
+
+def _stream_anthropic(client, request: Dict) -> str:
+    """
+    Stream an Anthropic response, closing the stream after the first paragraph.
+    
+    Closing the stream early stops generation, so tokens the model would
+    write after the requested paragraph are neither waited for nor billed.
+    
+    Args:
+        client: Anthropic client
+        request: Keyword arguments for messages.stream
+        
+    Returns:
+        str: Response text
+    """
+    with client.messages.stream(**request) as stream:
+        return _read_first_paragraph(stream.text_stream)
+
+async def _stream_anthropic_async(client, request: Dict) -> str:
+    """
+    Stream an Anthropic response without blocking the event loop, closing it after the first paragraph.
+    
+    Args:
+        client: AsyncAnthropic client
+        request: Keyword arguments for messages.stream
+        
+    Returns:
+        str: Response text
+    """
+    async with client.messages.stream(**request) as stream:
+        return await _read_first_paragraph_async(stream.text_stream)
+
+def _chunk_texts(response):
+    """Yield the text of each streamed Gemini chunk, skipping chunks without text parts."""
+    for chunk in response:
+        try:
+            yield chunk.text
+        except ValueError:
+            continue
+
+async def _chunk_texts_async(response):
+    """Yield the text of each streamed Gemini chunk, skipping chunks without text parts."""
+    async for chunk in response:
+        try:
+            yield chunk.text
+        except ValueError:
+            continue
+
+def _stream_google(model, content) -> str:
+    """
+    Stream a Gemini response, stopping after the first paragraph.
+    
+    Args:
+        model: GenerativeModel
+        content: Prompt text, or prompt text and image
+        
+    Returns:
+        str: Response text
+    """
+    return _read_first_paragraph(_chunk_texts(model.generate_content(content, stream=True)))
+
+async def _stream_google_async(model, content) -> str:
+    """
+    Stream a Gemini response without blocking the event loop, stopping after the first paragraph.
+    
+    Args:
+        model: GenerativeModel
+        content: Prompt text, or prompt text and image
+        
+    Returns:
+        str: Response text
+    """
+    response = await model.generate_content_async(content, stream=True)
+    return await _read_first_paragraph_async(_chunk_texts_async(response))
+
+@lru_cache(maxsize=256)
+def _anthropic_text_completion(client, model: str, max_tokens: int, temperature: float, prompt: str) -> str:
+    """
+    Send a text prompt to Anthropic, answering repeated identical prompts from memory.
+    
+    Failures raise rather than return, so they are never cached.
+    
+    Args:
+        client: Anthropic client
+        model: Model name
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+        prompt: Complete prompt text
+        
+    Returns:
+        str: Response text
+    """
+    return _call_with_retries('anthropic', lambda: _stream_anthropic(client, {
+        'model': model,
+        'max_tokens': max_tokens,
+        'temperature': temperature,
+        'messages': [
+            {"role": "user", "content": prompt}
+        ]
+    }))
+
+@lru_cache(maxsize=256)
+def _google_text_completion(model, prompt: str) -> str:
+    """
+    Send a text prompt to Gemini, answering repeated identical prompts from memory.
+    
+    Failures raise rather than return, so they are never cached.
+    
+    Args:
+        model: GenerativeModel
+        prompt: Complete prompt text
+        
+    Returns:
+        str: Response text
+    """
+    return _call_with_retries('google', lambda: _stream_google(model, prompt))
+
+def get_slide_context(slide_data: Union[Slide, Dict]) -> str:
     """
     Extract relevant context from slide data for LLM analysis.
     
     Args:
-        slide_data: Dictionary containing slide information
+        slide_data: Slide or dictionary containing slide information
+        
+    Returns:
+        str: Formatted context string
+    """
+    slide = _as_slide(slide_data)
+    anim_details = slide.animation_details
+    key = (
+        slide.number,
+        slide.title,
+        slide.notes,
+        slide.animation_summary,
+        tuple(anim.get('description', 'Unknown animation') for anim in anim_details[:3]),  # Limit to first 3 for context
+        len(anim_details),
+    )
+    return _build_context(key)
+
+@lru_cache(maxsize=512)
+def _build_context(key: tuple) -> str:
+    """
+    Format the context string for a slide's relevant fields.
+    
+    Slides with the same fields share one cached string rather than each
+    building its own copy.
+    
+    Args:
+        key: (number, title, notes, animation summary, first animation descriptions,
+            animation count) as gathered by get_slide_context
         
     Returns:
         str: Formatted context string
     """
+    slide_num, title, notes, anim_summary, anim_descriptions, anim_count = key
     context_parts = []
     
     # Add slide number and title
-    slide_num = slide_data.get('number', 'Unknown')
-    title = slide_data.get('title', '').strip()
+    title = title.strip()
     if title:
         context_parts.append(f"Slide {slide_num}: {title}")
     else:
         context_parts.append(f"Slide {slide_num}")
     
     # Add notes if available
-    notes = slide_data.get('notes', '').strip()
+    notes = notes.strip()
     if notes:
         context_parts.append(f"\nSpeaker Notes:\n{notes}")
     
     # Add animation summary if available
-    anim_summary = slide_data.get('animation_summary', '').strip()
+    anim_summary = anim_summary.strip()
     if anim_summary and anim_summary != "This slide has no animations.":
         context_parts.append(f"\nAnimations:\n{anim_summary}")
     
     # Add brief animation details if present
-    anim_details = slide_data.get('animation_details', [])
-    if anim_details:
+    if anim_count:
         context_parts.append(f"\nAnimation Effects:")
-        for i, anim in enumerate(anim_details[:3]):  # Limit to first 3 for context
-            desc = anim.get('description', 'Unknown animation')
+        for desc in anim_descriptions:
             context_parts.append(f"- {desc}")
-        if len(anim_details) > 3:
-            context_parts.append(f"- ... and {len(anim_details) - 3} more animations")
+        if anim_count > 3:
+            context_parts.append(f"- ... and {anim_count - 3} more animations")
     
     return "\n".join(context_parts)
 
+def _is_degenerate(slide: Slide, method: str = "text") -> bool:
+    """
+    Check whether a slide has no content for the LLM to say anything specific about.
+    
+    Args:
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        
+    Returns:
+        bool: True if the slide has no title, body text, notes or animations and
+            would not be sent as an image
+    """
+    if method == "images" and slide.image_path is not None:
+        return False
+    title = (slide.title or "").strip()
+    anim_summary = (slide.animation_summary or "").strip()
+    return ((not title or title == "Untitled")
+            and not slide.text.strip()
+            and not (slide.notes or "").strip()
+            and (not anim_summary or anim_summary == "This slide has no animations.")
+            and not slide.animation_details
+            and not slide.animation_sequence)
+
+def _placeholder_recommendation(slide: Slide, last_slide: Optional[int] = None) -> str:
+    """
+    Get a recommendation for a degenerate slide from its position in the deck.
+    
+    Args:
+        slide: The slide
+        last_slide: Number of the last slide in the presentation, if known
+        
+    Returns:
+        str: Usage recommendation paragraph
+    """
+    if slide.number == 1:
+        return _OPENING_SLIDE_RECOMMENDATION
+    if last_slide is not None and slide.number == last_slide:
+        return _CLOSING_SLIDE_RECOMMENDATION
+    return _DIVIDER_SLIDE_RECOMMENDATION
+
+def _dedupe_key(slide: Slide, method: str = "text") -> Optional[str]:
+    """
+    Get the key under which slides can share a recommendation within a run.
+    
+    Args:
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        
+    Returns:
+        Optional[str]: Slide context without the slide number, or None if the
+            recommendation is image-based
+    """
+    if method == "images" and slide.image_path is not None:
+        return None
+    context = get_slide_context(slide)
+    prefix = f"Slide {slide.number}"
+    return context[len(prefix):] if context.startswith(prefix) else context
+
+@lru_cache(maxsize=1)
 def load_system_message() -> str:
     """
     Load the system message from the system_message.md file.
     
+    The file is read and parsed once per process.
+    
     Returns:
         str: System message template
     """
@@ -104,17 +730,7 @@ def load_system_message() -> str:
     except Exception as e:
         logger.error(f"Error loading system message: {e}")
         # Fallback to embedded prompt
-        return """You are a presentation expert analyzing PowerPoint slides. Based on the following slide information, write a single paragraph (3-5 sentences) describing when and how a presenter would want to use this slide. Focus on the practical purpose and ideal usage scenarios.
-
-{context}
-
-Provide a recommendation that:
-1. Identifies the slide's primary purpose
-2. Suggests when in a presentation it would be most effective
-3. Describes what type of content or message it's designed to convey
-4. Mentions any special features (animations, layout) that enhance its effectiveness
-
-Write in a professional, helpful tone as if advising a presenter preparing their talk."""
+        return _PROMPT_TEMPLATE
 
 def create_recommendation_prompt(context: str) -> str:
     """
@@ -126,44 +742,137 @@ def create_recommendation_prompt(context: str) -> str:
     Returns:
         str: Formatted prompt
     """
-    system_message = load_system_message()
-    return system_message.format(context=context)
+    before, after = _prompt_template_parts()
+    return before + context + after
 
-def generate_anthropic_recommendation(slide_data: Dict, api_key: str, method: str = "text") -> str:
+@lru_cache(maxsize=1)
+def _prompt_template_parts() -> Tuple[str, str]:
     """
-    Generate usage recommendation using Anthropic's Claude.
+    Split the system message around its context placeholder, once per process.
+    
+    Returns:
+        Tuple[str, str]: Template text before and after {context}, with escaped braces resolved
+    """
+    before, _, after = load_system_message().partition("{context}")
+    return (before.replace("{{", "{").replace("}}", "}"),
+            after.replace("{{", "{").replace("}}", "}"))
+
+@lru_cache(maxsize=1)
+def _image_prompt() -> str:
+    """
+    Get the prompt sent alongside a slide image.
+    
+    Returns:
+        str: System message with the context placeholder pointing at the image
+    """
+    before, after = _prompt_template_parts()
+    return before + "Based on this PowerPoint slide image:" + after
+
+def _prepare_image_payload(image_path: str) -> Tuple[Optional[str], str]:
+    """
+    Base64-encode a slide image for the Messages API.
+    
+    Slides rendered at print resolution are far larger than the model uses, so
+    the image is scaled down to _MAX_IMAGE_EDGE on its long side and sent as a
+    JPEG when Pillow is available. This is CPU-bound, so it is a module-level
+    function that can run in a worker process.
     
     Args:
-        slide_data: Dictionary containing slide information
-        api_key: API key for Anthropic
-        method: Recommendation method ("text" or "images")
+        image_path: Path to the slide image
         
     Returns:
-        str: Usage recommendation paragraph
+        Tuple[Optional[str], str]: Media type (None if the file was sent as-is) and base64 data
     """
-    if not ANTHROPIC_AVAILABLE:
-        return "Recommendation generation unavailable: Anthropic library not installed"
+    import base64
     
     try:
-        # Get API configuration
-        config = get_config()
-        api_config = config.get_api_config('anthropic')
-        image_settings = config.get('image_settings', {})
+        from PIL import Image
+    except ImportError:
+        with open(image_path, "rb") as image_file:
+            return None, base64.b64encode(image_file.read()).decode('utf-8')
+    
+    with Image.open(image_path) as image:
+        image = image.convert('RGB')
+        image.thumbnail((_MAX_IMAGE_EDGE, _MAX_IMAGE_EDGE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=_JPEG_QUALITY)
+    return 'image/jpeg', base64.b64encode(buffer.getbuffer()).decode('ascii')
+
+@lru_cache(maxsize=64)
+def _encode_image(image_path: str, mtime_ns: int, size: int) -> Tuple[Optional[str], str]:
+    """
+    Base64-encode a slide image for the Messages API, once per version of the file.
+    
+    Args:
+        image_path: Path to the slide image
+        mtime_ns: Modification time of the file, in nanoseconds (part of the cache key)
+        size: Size of the file in bytes (part of the cache key)
         
-        client = Anthropic(api_key=api_key)
+    Returns:
+        Tuple[Optional[str], str]: Media type (None if the file was sent as-is) and base64 data
+    """
+    return _prepare_image_payload(image_path)
+
+async def _encode_image_async(image_path: str, pool: ProcessPoolExecutor) -> Tuple[Optional[str], str]:
+    """
+    Base64-encode a slide image in a worker process without blocking the event loop.
+    
+    Args:
+        image_path: Path to the slide image
+        pool: Process pool to encode the image in
         
-        if method == "images" and "image_path" in slide_data:
-            # Use image-based recommendation
-            import base64
-            
-            image_path = slide_data["image_path"]
-            if not os.path.exists(image_path):
-                return f"Error: Image file not found at {image_path}"
-            
-            # Read and encode the image
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+    Returns:
+        Tuple[Optional[str], str]: Media type (None if the file was sent as-is) and base64 data
+        
+    Raises:
+        FileNotFoundError: If the slide image is missing
+    """
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        raise FileNotFoundError(f"Image file not found at {image_path}") from None
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, _prepare_image_payload, image_path)
+    except Exception as e:
+        logger.warning(f"Encoding {image_path} in a worker process failed, encoding it in a thread: {e}")
+        return await loop.run_in_executor(None, _encode_image, image_path, stat.st_mtime_ns, stat.st_size)
+
+def _build_anthropic_request(slide: Slide, method: str = "text",
+                             image_payload: Optional[Tuple[Optional[str], str]] = None) -> Dict:
+    """
+    Build the Messages API arguments for a slide recommendation.
+    
+    Args:
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        image_payload: Media type and base64 data of the slide image, if already encoded
+        
+    Returns:
+        Dict: Keyword arguments for messages.create
+        
+    Raises:
+        FileNotFoundError: If the image method is used and the slide image is missing
+    """
+    # Get API configuration
+    config = get_config()
+    api_config = config.get_api_config('anthropic')
+    image_settings = config.get('image_settings', {})
+    
+    if method == "images" and slide.image_path is not None:
+        # Use image-based recommendation
+        image_path = slide.image_path
+        if image_payload is None:
+            try:
+                stat = os.stat(image_path)
+            except OSError:
+                raise FileNotFoundError(f"Image file not found at {image_path}") from None
             
+            # Read and encode the image, once per version of the file
+            image_payload = _encode_image(image_path, stat.st_mtime_ns, stat.st_size)
+        media_type, image_data = image_payload
+        if media_type is None:
             # Determine image media type using configuration
             image_ext = os.path.splitext(image_path)[1].lower()
             media_type_map = image_settings.get('supported_media_types', {
@@ -174,67 +883,278 @@ def generate_anthropic_recommendation(slide_data: Dict, api_key: str, method: st
                 '.bmp': 'image/bmp'
             })
             media_type = media_type_map.get(image_ext, 'image/png')
-            
-            # Create prompt for image analysis using system message
-            system_message = load_system_message()
-            image_prompt = system_message.replace("{context}", "Based on this PowerPoint slide image:")
-            
-            # Make API call with image using configuration
-            response = client.messages.create(
-                model=api_config.get('model', 'claude-3-haiku-20240307'),
-                max_tokens=api_config.get('max_tokens', 200),
-                temperature=api_config.get('temperature', 0.7),
-                messages=[
+        
+        # Create prompt for image analysis using system message
+        image_prompt = _image_prompt()
+        
+        messages = [
+            {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_data
-                                }
-                            },
-                            {
-                                "type": "text",
-                                "text": image_prompt
-                            }
-                        ]
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": media_type,
+                            "data": image_data
+                        }
+                    },
+                    {
+                        "type": "text",
+                        "text": image_prompt
                     }
                 ]
-            )
-        else:
-            # Use text-based recommendation (existing functionality)
-            context = get_slide_context(slide_data)
-            prompt = create_recommendation_prompt(context)
-
-            # Make API call using configuration
-            response = client.messages.create(
-                model=api_config.get('model', 'claude-3-haiku-20240307'),
-                max_tokens=api_config.get('max_tokens', 200),
-                temperature=api_config.get('temperature', 0.7),
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            }
+        ]
+    else:
+        # Use text-based recommendation (existing functionality)
+        context = get_slide_context(slide)
+        prompt = create_recommendation_prompt(context)
+        messages = [
+            {"role": "user", "content": prompt}
+        ]
+    
+    return {
+        'model': api_config.get('model', 'claude-3-haiku-20240307'),
+        'max_tokens': api_config.get('max_tokens', 200),
+        'temperature': api_config.get('temperature', 0.7),
+        'messages': messages
+    }
+
+def generate_anthropic_recommendation(slide_data: Union[Slide, Dict], api_key: str, method: str = "text",
+                                      client=None) -> str:
+    """
+    Generate usage recommendation using Anthropic's Claude.
+    
+    Args:
+        slide_data: Slide or dictionary containing slide information
+        api_key: API key for Anthropic
+        method: Recommendation method ("text" or "images")
+        client: Anthropic client to reuse (default: the shared client for api_key)
+        
+    Returns:
+        str: Usage recommendation paragraph
+    """
+    if _lazy_anthropic() is None:
+        return "Recommendation generation unavailable: Anthropic library not installed"
+    
+    slide = _as_slide(slide_data)
+    try:
+        request = _build_anthropic_request(slide, method)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
+    
+    try:
+        if client is None:
+            client = _get_client(api_key)
+        
+        prompt = request['messages'][0]['content']
+        if isinstance(prompt, str):
+            # Text prompts depend only on the slide context, so identical ones are sent once
+            return _anthropic_text_completion(client, request['model'], request['max_tokens'],
+                                              request['temperature'], prompt)
         
-        return response.content[0].text.strip()
+        # Make API call using configuration
+        return _call_with_retries('anthropic', lambda: _stream_anthropic(client, request))
         
     except Exception as e:
-        logger.error(f"Error generating Anthropic recommendation for slide {slide_data.get('number', 'Unknown')}: {e}")
+        logger.error(f"Error generating Anthropic recommendation for slide {slide.number}: {e}")
         return f"Error generating recommendation: {str(e)}"
 
-def generate_google_recommendation(slide_data: Dict, api_key: str, method: str = "text") -> str:
+async def _generate_anthropic_recommendation_async(client, slide: Slide, method: str,
+                                                   semaphore: asyncio.Semaphore,
+                                                   image_pool: Optional[ProcessPoolExecutor] = None) -> str:
+    """
+    Generate usage recommendation using Anthropic's Claude without blocking the event loop.
+    
+    Args:
+        client: Shared AsyncAnthropic client
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        semaphore: Semaphore bounding the number of requests in flight
+        image_pool: Process pool to encode the slide image in
+        
+    Returns:
+        str: Usage recommendation paragraph
+    """
+    try:
+        image_payload = None
+        if image_pool is not None and method == "images" and slide.image_path is not None:
+            image_payload = await _encode_image_async(slide.image_path, image_pool)
+        request = _build_anthropic_request(slide, method, image_payload)
+    except FileNotFoundError as e:
+        return f"Error: {e}"
+    
+    try:
+        async with semaphore:
+            logger.info(f"Generating recommendation for slide {slide.number}")
+            return await _call_with_retries_async('anthropic', lambda: _stream_anthropic_async(client, request))
+        
+    except Exception as e:
+        logger.error(f"Error generating Anthropic recommendation for slide {slide.number}: {e}")
+        return f"Error generating recommendation: {str(e)}"
+
+async def _gather_recommendations(slides: List[Slide], generate) -> List[str]:
+    """
+    Run recommendation coroutines for several slides concurrently.
+    
+    Args:
+        slides: List of slides
+        generate: Function taking a slide and returning a coroutine for its recommendation
+        
+    Returns:
+        List[str]: Recommendations in the same order as slides
+    """
+    return await asyncio.gather(*(generate(slide) for slide in slides))
+
+async def _generate_all_anthropic_async(slides: List[Slide], api_key: str, method: str,
+                                        concurrency: int = _MAX_CONCURRENT_REQUESTS) -> List[str]:
+    """
+    Generate Anthropic recommendations for several slides concurrently.
+    
+    Args:
+        slides: List of slides
+        api_key: API key for Anthropic
+        method: Recommendation method ("text" or "images")
+        concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        List[str]: Recommendations in the same order as slides
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    client = _lazy_anthropic().AsyncAnthropic(api_key=api_key, max_retries=0,
+                                              **_http_client_options(async_client=True))
+    
+    # Decoding, scaling and encoding slide images holds the GIL, so it runs in
+    # worker processes while the requests stay on the event loop
+    image_pool = None
+    image_count = sum(1 for slide in slides if slide.image_path is not None) if method == "images" else 0
+    if image_count > 1:
+        image_pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, image_count))
+    try:
+        return await _gather_recommendations(
+            slides,
+            lambda slide: _generate_anthropic_recommendation_async(client, slide, method, semaphore, image_pool))
+    finally:
+        await client.close()
+        if image_pool is not None:
+            image_pool.shutdown()
+
+def _generate_all_anthropic_batch(slides: List[Slide], api_key: str, method: str) -> List[str]:
+    """
+    Generate Anthropic recommendations for several slides with one Message Batches request.
+    
+    Batches are billed at a discount and are not subject to the per-request
+    rate limits, at the cost of waiting for the whole batch to finish. If the
+    batch does not end within processing.recommendations.batch_timeout_seconds,
+    or polling it fails or is interrupted, the batch is cancelled before the error is raised so
+    that a fallback to individual requests is not billed twice.
+    
+    Args:
+        slides: List of slides
+        api_key: API key for Anthropic
+        method: Recommendation method ("text" or "images")
+        
+    Returns:
+        List[str]: Recommendations in the same order as slides
+        
+    Raises:
+        TimeoutError: If the batch did not end in time
+    """
+    recommendations = [None] * len(slides)
+    requests = []
+    for index, slide in enumerate(slides):
+        try:
+            params = _build_anthropic_request(slide, method)
+        except FileNotFoundError as e:
+            recommendations[index] = f"Error: {e}"
+            continue
+        requests.append({'custom_id': f"slide_{index}", 'params': params})
+    
+    if requests:
+        batches = _get_client(api_key).messages.batches
+        batch = _call_with_retries('anthropic', lambda: batches.create(requests=requests))
+        batch_id = batch.id
+        logger.info(f"Submitted batch {batch_id} with {len(requests)} recommendation requests")
+        
+        timeout = get_config().get('processing.recommendations.batch_timeout_seconds', _BATCH_TIMEOUT_SECONDS)
+        deadline = time.monotonic() + timeout
+        # Cancel on interrupts too, so Ctrl-C while waiting does not leave a billed batch running
+        try:
+            while batch.processing_status != 'ended':
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"batch {batch_id} did not finish within {timeout}s")
+                time.sleep(_BATCH_POLL_SECONDS)
+                batch = _call_with_retries('anthropic', lambda: batches.retrieve(batch_id))
+                logger.debug(f"Batch {batch_id} status: {batch.processing_status}")
+            
+            results = _call_with_retries('anthropic', lambda: list(batches.results(batch_id)))
+        except BaseException:
+            try:
+                batches.cancel(batch_id)
+                logger.info(f"Cancelled batch {batch_id}")
+            except Exception as e:
+                logger.warning(f"Could not cancel batch {batch_id}: {e}")
+            raise
+        
+        for entry in results:
+            index = int(entry.custom_id.split('_')[1])
+            if entry.result.type == 'succeeded':
+                # Cut to the first paragraph, as the streamed requests are
+                recommendations[index] = _read_first_paragraph((entry.result.message.content[0].text,))
+            else:
+                logger.error(f"Error generating Anthropic recommendation for slide {slides[index].number}: batch request {entry.result.type}")
+                recommendations[index] = f"Error generating recommendation: batch request {entry.result.type}"
+    
+    # Requests missing from the results count as failures
+    return [recommendation if recommendation is not None else "Error generating recommendation: no batch result"
+            for recommendation in recommendations]
+
+def _build_google_content(slide: Slide, method: str = "text"):
+    """
+    Build the Gemini content for a slide recommendation.
+    
+    Args:
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        
+    Returns:
+        str or list: Prompt text, or [prompt, image] for image-based recommendations
+        
+    Raises:
+        FileNotFoundError: If the image method is used and the slide image is missing
+    """
+    if method == "images" and slide.image_path is not None:
+        # Use image-based recommendation
+        from PIL import Image
+        
+        image_path = slide.image_path
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found at {image_path}")
+        
+        # Load the image
+        image = Image.open(image_path)
+        
+        # Create prompt for image analysis using system message
+        image_prompt = _image_prompt()
+        return [image_prompt, image]
+    
+    # Use text-based recommendation (existing functionality)
+    context = get_slide_context(slide)
+    return create_recommendation_prompt(context)
+
+def generate_google_recommendation(slide_data: Union[Slide, Dict], api_key: str, method: str = "text",
+                                   client=None) -> str:
     """
     Generate usage recommendation using Google's Gemini.
     
     For available model names, see: https://ai.google.dev/gemini-api/docs/models
     
     Args:
-        slide_data: Dictionary containing slide information
+        slide_data: Slide or dictionary containing slide information
         api_key: API key for Google
         method: Recommendation method ("text" or "images")
+        client: GenerativeModel to reuse (default: the shared model for api_key)
         
     Returns:
         str: Usage recommendation paragraph
@@ -242,68 +1162,179 @@ def generate_google_recommendation(slide_data: Dict, api_key: str, method: str =
     if not GOOGLE_AVAILABLE:
         return "Recommendation generation unavailable: Google Generative AI library not installed"
     
+    slide = _as_slide(slide_data)
     try:
-        # Get API configuration
-        config = get_config()
-        api_config = config.get_api_config('google')
+        model = client
+        if model is None:
+            # Create the model using configuration
+            model_name = get_config().get_api_config('google').get('model', 'gemini-2.5-pro-preview-06-05')
+            model = _get_google_model(api_key, model_name)
         
-        # Configure Google AI
-        genai.configure(api_key=api_key)
+        try:
+            content = _build_google_content(slide, method)
+        except FileNotFoundError as e:
+            return f"Error: {e}"
         
-        # Create the model using configuration
-        model_name = api_config.get('model', 'gemini-2.5-pro-preview-06-05')
-        model = genai.GenerativeModel(model_name)
+        if isinstance(content, str):
+            # Generate content, once per distinct prompt
+            return _google_text_completion(model, content)
         
-        if method == "images" and "image_path" in slide_data:
-            # Use image-based recommendation
-            from PIL import Image
-            
-            image_path = slide_data["image_path"]
-            if not os.path.exists(image_path):
-                return f"Error: Image file not found at {image_path}"
-            
-            # Load the image
-            image = Image.open(image_path)
-            
-            # Create prompt for image analysis using system message
-            system_message = load_system_message()
-            image_prompt = system_message.replace("{context}", "Based on this PowerPoint slide image:")
-            
-            # Generate content with image
-            response = model.generate_content([image_prompt, image])
-        else:
-            # Use text-based recommendation (existing functionality)
-            context = get_slide_context(slide_data)
-            prompt = create_recommendation_prompt(context)
-            
-            # Generate content
-            response = model.generate_content(prompt)
+        # Generate content with image
+        return _call_with_retries('google', lambda: _stream_google(model, content))
         
-        return response.text.strip()
+    except Exception as e:
+        logger.error(f"Error generating Google recommendation for slide {slide.number}: {e}")
+        return f"Error generating recommendation: {str(e)}"
+
+async def _generate_google_recommendation_async(model, slide: Slide, method: str,
+                                                semaphore: asyncio.Semaphore) -> str:
+    """
+    Generate usage recommendation using Google's Gemini without blocking the event loop.
+    
+    Args:
+        model: Shared GenerativeModel
+        slide: The slide
+        method: Recommendation method ("text" or "images")
+        semaphore: Semaphore bounding the number of requests in flight
+        
+    Returns:
+        str: Usage recommendation paragraph
+    """
+    try:
+        try:
+            content = _build_google_content(slide, method)
+        except FileNotFoundError as e:
+            return f"Error: {e}"
+        
+        async with semaphore:
+            logger.info(f"Generating recommendation for slide {slide.number}")
+            return await _call_with_retries_async('google', lambda: _stream_google_async(model, content))
         
     except Exception as e:
-        logger.error(f"Error generating Google recommendation for slide {slide_data.get('number', 'Unknown')}: {e}")
+        logger.error(f"Error generating Google recommendation for slide {slide.number}: {e}")
         return f"Error generating recommendation: {str(e)}"
 
-def generate_recommendation(slide_data: Dict, api_key: str, provider: str = "anthropic", method: str = "text") -> str:
+async def _generate_all_google_async(slides: List[Slide], api_key: str, method: str,
+                                     concurrency: int = _MAX_CONCURRENT_REQUESTS) -> List[str]:
+    """
+    Generate Google recommendations for several slides concurrently.
+    
+    Args:
+        slides: List of slides
+        api_key: API key for Google
+        method: Recommendation method ("text" or "images")
+        concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        List[str]: Recommendations in the same order as slides
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    model_name = get_config().get_api_config('google').get('model', 'gemini-2.5-pro-preview-06-05')
+    model = _get_google_model(api_key, model_name)
+    return await _gather_recommendations(
+        slides,
+        lambda slide: _generate_google_recommendation_async(model, slide, method, semaphore))
+
+def generate_recommendation(slide_data: Union[Slide, Dict], api_key: str, provider: str = "anthropic", method: str = "text",
+                            use_cache: bool = True, client=None) -> str:
     """
     Generate usage recommendation for a slide using the specified LLM provider.
     
     Args:
-        slide_data: Dictionary containing slide information
+        slide_data: Slide or dictionary containing slide information
         api_key: API key for the LLM service
         provider: LLM provider to use ("anthropic" or "google")
         method: Recommendation method ("text" or "images")
+        use_cache: Whether to reuse and store text recommendations in the recommendation cache
+        client: Provider client to reuse (an Anthropic client or a Gemini GenerativeModel)
         
     Returns:
         str: Usage recommendation paragraph
     """
+    slide = _as_slide(slide_data)
+    if _is_degenerate(slide, method):
+        logger.debug(f"Slide {slide.number} has no content; skipping the API call")
+        return _placeholder_recommendation(slide)
+    
+    scope = _cache_scope(slide, provider, method) if use_cache else None
+    if scope is not None:
+        context = get_slide_context(slide)
+        recommendation = _get_cache().get(scope, context)
+        if recommendation is not None:
+            return recommendation
+    
     if provider == "google":
-        return generate_google_recommendation(slide_data, api_key, method)
+        recommendation = generate_google_recommendation(slide, api_key, method, client)
     else:
-        return generate_anthropic_recommendation(slide_data, api_key, method)
+        recommendation = generate_anthropic_recommendation(slide, api_key, method, client)
+    
+    if scope is not None and not _is_failure(recommendation):
+        _get_cache().set(scope, context, recommendation)
+    return recommendation
 
-def generate_all_recommendations(slides_data: Dict, api_key: str, provider: str = "anthropic", method: str = "text") -> Dict:
+@lru_cache(maxsize=1)
+def _get_cache() -> SemanticCache:
+    """
+    Get the shared recommendation cache, configured from processing.recommendations.cache.
+    
+    The database is stored at processing.recommendations.cache.path, or
+    ~/.pptx_extractor/llm_cache.sqlite when no path is configured.
+    
+    Returns:
+        SemanticCache: Recommendation cache
+    """
+    cache_config = get_config().get('processing.recommendations.cache', {})
+    ttl_days = cache_config.get('ttl_days', 30)
+    path = cache_config.get('path')
+    return SemanticCache(
+        path=Path(path).expanduser() if path else None,
+        ttl_seconds=ttl_days * 24 * 3600 if ttl_days is not None else None,
+        semantic=cache_config.get('semantic', False),
+        similarity_threshold=cache_config.get('similarity_threshold', 0.9),
+    )
+
+def _cache_scope(slide: Slide, provider: str, method: str) -> Optional[str]:
+    """
+    Get the cache scope for a slide's recommendation.
+    
+    Cached recommendations are only reused for the same provider, model and
+    prompt template, so a change to any of them is a cache miss.
+    
+    Args:
+        slide: The slide
+        provider: LLM provider to use ("anthropic" or "google")
+        method: Recommendation method ("text" or "images")
+        
+    Returns:
+        Optional[str]: Cache scope, or None if the recommendation is image-based
+    """
+    if method == "images" and slide.image_path is not None:
+        return None
+    
+    provider = "google" if provider == "google" else "anthropic"
+    model = get_config().get_api_config(provider).get('model', '')
+    return f"{provider}\n{model}\n{load_system_message()}"
+
+def _is_failure(recommendation: str) -> bool:
+    """Check whether a generated recommendation reports a failure rather than a result."""
+    return recommendation.startswith(("Error", "Recommendation generation unavailable"))
+
+def _in_event_loop() -> bool:
+    """
+    Check whether the caller is already running inside an asyncio event loop.
+    
+    Returns:
+        bool: True if an event loop is running in this thread
+    """
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+def generate_all_recommendations(slides_data: Dict, api_key: str, provider: str = "anthropic", method: str = "text",
+                                 use_cache: bool = True, concurrency: Optional[int] = None,
+                                 use_batch: bool = False) -> Dict:
     """
     Generate recommendations for all slides in the presentation.
     
@@ -312,6 +1343,10 @@ def generate_all_recommendations(slides_data: Dict, api_key: str, provider: str
         api_key: API key for the LLM service
         provider: LLM provider to use ("anthropic" or "google")
         method: Recommendation method ("text" or "images")
+        use_cache: Whether to reuse and store text recommendations in the recommendation cache
+        concurrency: Maximum number of requests in flight at once (default: 8)
+        use_batch: Whether to send Anthropic requests as one Message Batches request
+            (only for 5 or more slides)
         
     Returns:
         Dict: Updated slides data with recommendations
@@ -329,13 +1364,101 @@ def generate_all_recommendations(slides_data: Dict, api_key: str, provider: str
                 logger.error("No API key provided. Use --api-key or set ANTHROPIC_API_KEY environment variable")
                 return slides_data
     
-    logger.info(f"Generating recommendations using {provider} for {len(slides_data.get('slides', []))} slides...")
+    slides = slides_data.get('slides', [])
+    logger.info(f"Generating recommendations using {provider} for {len(slides)} slides...")
     
-    for slide in slides_data.get('slides', []):
-        slide_num = slide.get('number', 'Unknown')
-        logger.info(f"Generating recommendation for slide {slide_num}")
+    # Read each slide dictionary once up front
+    slide_objs = [Slide.from_dict(slide) for slide in slides]
+    recommendations = [None] * len(slide_objs)
+    
+    # Slides with no content at all get a recommendation from their position
+    last_slide = max((slide.number for slide in slide_objs if isinstance(slide.number, int)), default=None)
+    skipped = 0
+    for index, slide in enumerate(slide_objs):
+        if _is_degenerate(slide, method):
+            recommendations[index] = _placeholder_recommendation(slide, last_slide)
+            skipped += 1
+    if skipped:
+        logger.info(f"Skipping {skipped} slides with no content")
+    
+    # Answer what we can from the recommendation cache; only the rest go to the API
+    cache_scopes = [_cache_scope(slide, provider, method) if use_cache else None for slide in slide_objs]
+    pending = []
+    cached = 0
+    for index, scope in enumerate(cache_scopes):
+        if recommendations[index] is not None:
+            continue
+        if scope is not None:
+            recommendations[index] = _get_cache().get(scope, get_slide_context(slide_objs[index]))
+        if recommendations[index] is None:
+            pending.append(index)
+        else:
+            cached += 1
+    if cached:
+        logger.info(f"Reusing {cached} cached recommendations")
+    
+    # Slides whose content matches an earlier slide's apart from the slide number share its request
+    requested = []
+    duplicates = []
+    first_by_key = {}
+    for index in pending:
+        key = _dedupe_key(slide_objs[index], method)
+        first = first_by_key.setdefault(key, index) if key is not None else index
+        if first == index:
+            requested.append(index)
+        else:
+            duplicates.append((index, first))
+    if duplicates:
+        logger.info(f"Reusing recommendations for {len(duplicates)} slides with duplicate content")
+    
+    pending_slides = [slide_objs[index] for index in requested]
+    anthropic_available = provider != "google" and _lazy_anthropic() is not None
+    generated = None
+    if use_batch and anthropic_available and len(pending_slides) >= _MIN_BATCH_SIZE:
+        try:
+            generated = _generate_all_anthropic_batch(pending_slides, api_key, method)
+        except Exception as e:
+            logger.warning(f"Batch request failed, sending recommendation requests individually: {e}")
+    
+    generate_all_async = None
+    if generated is None and len(pending_slides) > 1 and not _in_event_loop():
+        if provider == "google":
+            if GOOGLE_AVAILABLE:
+                generate_all_async = _generate_all_google_async
+        elif anthropic_available:
+            generate_all_async = _generate_all_anthropic_async
+    
+    if generate_all_async is not None:
+        # Send the requests concurrently over one shared client
+        concurrency = concurrency or _MAX_CONCURRENT_REQUESTS
+        logger.info(f"Sending up to {concurrency} recommendation requests at a time")
+        generated = asyncio.run(generate_all_async(pending_slides, api_key, method, concurrency))
+    elif generated is None:
+        # Send the requests one at a time over one shared client
+        client = None
+        if provider == "google":
+            if GOOGLE_AVAILABLE:
+                model_name = get_config().get_api_config('google').get('model', 'gemini-2.5-pro-preview-06-05')
+                client = _get_google_model(api_key, model_name)
+        elif anthropic_available:
+            client = _get_client(api_key)
         
-        recommendation = generate_recommendation(slide, api_key, provider, method)
+        generated = []
+        for slide in pending_slides:
+            logger.info(f"Generating recommendation for slide {slide.number}")
+            generated.append(generate_recommendation(slide, api_key, provider, method, use_cache=False, client=client))
+    
+    for index, recommendation in zip(requested, generated):
+        recommendations[index] = recommendation
+    for index, first in duplicates:
+        recommendations[index] = recommendations[first]
+    
+    for index in pending:
+        recommendation = recommendations[index]
+        if cache_scopes[index] is not None and not _is_failure(recommendation):
+            _get_cache().set(cache_scopes[index], get_slide_context(slide_objs[index]), recommendation)
+    
+    for slide, recommendation in zip(slides, recommendations):
         # Only add recommendation if it doesn't start with "Error"
         if not recommendation.startswith("Error"):
             slide['recommended_usage'] = recommendation
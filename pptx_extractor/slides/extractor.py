@@ -5,121 +5,184 @@ Slides extraction functionality for PowerPoint presentations.
 import os
 import subprocess
 import logging
-import shutil
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pptx import Presentation
 
+from ..config import get_config
 from ..utils.common import ensure_directory, sanitize_filename, get_slide_title, get_slide_text_as_markdown
 
+# Render PDF pages in-process with PyMuPDF when available; otherwise fall back to pdf2image/poppler
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to rasterize and save slide images
+_MAX_CONVERSION_THREADS = 8
+
+# JPEG quality for slide images
+_JPEG_QUALITY = 85
+
+# zlib level for PNG output; level 1 is several times faster than the default 6
+# and barely larger on slide imagery
+_PNG_COMPRESS_LEVEL = 1
+
+def _conversion_threads():
+    """
+    Get the number of threads to use for PDF to image conversion.
+    
+    Returns:
+        int: processing.image_conversion.thread_count, or the CPU count (capped) if unset
+    """
+    thread_count = get_config().get('processing.image_conversion.thread_count')
+    if thread_count:
+        return thread_count
+    return min(os.cpu_count() or 1, _MAX_CONVERSION_THREADS)
+
+def _save_image(image, image_path, format):
+    """
+    Save a rendered page image.
+    
+    Args:
+        image (PIL.Image.Image): Rendered page
+        image_path (str): Path to save the image to
+        format (str): Image format
+        
+    Returns:
+        str: image_path
+    """
+    if format.lower() == 'png':
+        image.save(image_path, 'PNG', optimize=False, compress_level=_PNG_COMPRESS_LEVEL)
+    else:
+        # Pillow knows JPEG output only as 'JPEG', not 'JPG'
+        pil_format = 'JPEG' if format.lower() in ('jpg', 'jpeg') else format.upper()
+        if pil_format == 'JPEG':
+            image.save(image_path, pil_format, quality=_JPEG_QUALITY)
+        else:
+            image.save(image_path, pil_format)
+    return image_path
+
 def check_dependencies():
     """Check if required dependencies are installed.
     
+    Poppler is only needed when PyMuPDF is not installed, since PyMuPDF
+    renders the PDF pages in-process.
+    
     Returns:
         bool: True if all dependencies are installed, False otherwise
     """
     try:
         # Check if LibreOffice is installed
         subprocess.run(['which', 'soffice'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
+    except subprocess.CalledProcessError:
+        logger.error("Required dependency not found. Please install LibreOffice.")
+        return False
+    except Exception as e:
+        logger.error(f"Error checking dependencies: {e}")
+        return False
+    
+    if PYMUPDF_AVAILABLE:
+        return True
+    
+    try:
         # Check if Poppler is installed (for pdf2image)
         subprocess.run(['which', 'pdftoppm'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
         return True
     except subprocess.CalledProcessError:
-        logger.error("Required dependencies not found. Please install LibreOffice and Poppler.")
+        logger.error("Required dependency not found. Please install Poppler, "
+                     "or install PyMuPDF (pip install PyMuPDF) to render slides without it.")
         return False
     except Exception as e:
         logger.error(f"Error checking dependencies: {e}")
         return False
 
-def convert_pptx_to_pdf(pptx_path, output_dir):
+def convert_pptx_to_pdf(pptx_path, output_dir, slide_count=None):
     """Convert PowerPoint file to PDF using LibreOffice.
     
     Args:
         pptx_path (str): Path to the PowerPoint file
         output_dir (str): Directory to save the PDF file
+        slide_count (int): Number of slides, if already known (used for progress reporting)
         
     Returns:
         str: Path to the PDF file or None if conversion failed
     """
     try:
         import time
-        from pptx import Presentation
         
-        # Get slide count for progress reporting
-        try:
-            prs = Presentation(pptx_path)
-            slide_count = len(prs.slides)
-            logger.info(f"Starting conversion of PowerPoint with {slide_count} slides to PDF")
-        except Exception as e:
-            logger.warning(f"Could not determine slide count: {e}")
-            slide_count = "unknown number of"
+        # Get slide count for progress reporting, unless the caller already knows it
+        if slide_count is None:
+            try:
+                prs = Presentation(pptx_path)
+                slide_count = len(prs.slides)
+            except Exception as e:
+                logger.warning("Could not determine slide count: %s", e)
+                slide_count = "unknown number of"
+        if isinstance(slide_count, int):
+            logger.info("Starting conversion of PowerPoint with %d slides to PDF", slide_count)
         
-        logger.info(f"Converting {slide_count} slides from PowerPoint to PDF...")
+        logger.info("Converting %s slides from PowerPoint to PDF...", slide_count)
         logger.info("This may take some time for large presentations")
         
         start_time = time.time()
         
-        # Create a temporary directory for the conversion
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Convert PPTX to PDF
-            logger.info("Launching LibreOffice for conversion (this is a background process)...")
-            cmd = [
-                'soffice',
-                '--headless',
-                '--convert-to', 'pdf',
-                '--outdir', temp_dir,
-                pptx_path
-            ]
-            
-            # Run the conversion process with progress updates
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            # Provide periodic updates while waiting for conversion
-            while process.poll() is None:
+        # Convert PPTX to PDF, writing straight to the output directory
+        logger.info("Launching LibreOffice for conversion (this is a background process)...")
+        cmd = [
+            'soffice',
+            '--headless',
+            '--convert-to', 'pdf',
+            '--outdir', str(output_dir),
+            pptx_path
+        ]
+        
+        # Run the conversion process with progress updates
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        
+        # Provide periodic updates while waiting for conversion; the wait returns
+        # as soon as LibreOffice exits
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=5)
+                break
+            except subprocess.TimeoutExpired:
                 logger.info("PDF conversion in progress... (this may take several minutes)")
-                time.sleep(5)  # Check status every 5 seconds
-            
-            # Check if conversion was successful
-            if process.returncode != 0:
-                stderr = process.stderr.read().decode('utf-8', errors='ignore')
-                logger.error(f"LibreOffice conversion failed with error: {stderr}")
-                return None
-            
-            # Get the PDF file name
-            pdf_filename = os.path.splitext(os.path.basename(pptx_path))[0] + '.pdf'
-            pdf_path = os.path.join(temp_dir, pdf_filename)
-            
-            if not os.path.exists(pdf_path):
-                logger.error(f"PDF file not created at expected path: {pdf_path}")
-                return None
-            
-            # Copy the PDF file to the output directory
-            output_pdf = os.path.join(output_dir, pdf_filename)
-            shutil.copy2(pdf_path, output_pdf)
-            
-            conversion_time = time.time() - start_time
-            logger.info(f"Successfully converted {pptx_path} to {output_pdf} in {conversion_time:.2f} seconds")
-            return output_pdf
+        
+        # Check if conversion was successful
+        if process.returncode != 0:
+            logger.error("LibreOffice conversion failed with error: %s", stderr.decode('utf-8', errors='ignore'))
+            return None
+        
+        # Get the PDF file name
+        output_pdf = Path(output_dir) / f"{Path(pptx_path).stem}.pdf"
+        
+        if not output_pdf.exists():
+            logger.error("PDF file not created at expected path: %s", output_pdf)
+            return None
+        
+        conversion_time = time.time() - start_time
+        logger.info("Successfully converted %s to %s in %.2f seconds", pptx_path, output_pdf, conversion_time)
+        return str(output_pdf)
     except Exception as e:
-        logger.error(f"Error converting PPTX to PDF: {e}")
+        logger.error("Error converting PPTX to PDF: %s", e)
         return None
 
 def extract_slide_titles(pptx_path):
     """Extract titles from all slides in a PowerPoint file.
     
     Args:
-        pptx_path (str): Path to the PowerPoint file
+        pptx_path (str or Presentation): Path to the PowerPoint file, or an already opened presentation
         
     Returns:
         list: List of slide titles
     """
     titles = []
     try:
-        prs = Presentation(pptx_path)
+        prs = Presentation(pptx_path) if isinstance(pptx_path, (str, os.PathLike)) else pptx_path
         for slide in prs.slides:
             title = get_slide_title(slide)
             titles.append(title)
@@ -162,8 +225,111 @@ def extract_slide_text_data(pptx_path, slide_filter=None):
         logger.error(f"Error extracting slide text data: {e}")
         return {}
 
+def _render_with_pymupdf(pdf_path, output_dir, format, dpi, slide_filter):
+    """Render PDF pages to images in-process with PyMuPDF.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory to save the images
+        format (str): Image format
+        dpi (int): Image resolution
+        slide_filter (set): Set of slide numbers to extract (1-based), or None for all slides
+        
+    Returns:
+        list: List of paths to the generated images
+    """
+    output_path = Path(output_dir)
+    image_paths = []
+    with fitz.open(pdf_path) as doc:
+        total_pages = len(doc)
+        logger.info("Found %d pages in the PDF to convert", total_pages)
+        
+        if slide_filter:
+            page_numbers = sorted(page_num for page_num in slide_filter if 1 <= page_num <= total_pages)
+        else:
+            page_numbers = range(1, total_pages + 1)
+        
+        log_progress = logger.isEnabledFor(logging.DEBUG)
+        for i, page_num in enumerate(page_numbers):
+            if log_progress:
+                logger.debug("Rendering image %d/%d", i + 1, len(page_numbers))
+            
+            # Slides are opaque, so render without an alpha channel
+            pix = doc[page_num - 1].get_pixmap(dpi=dpi, colorspace=fitz.csRGB, alpha=False)
+            image_path = str(output_path / f"slide_{page_num}.{format}")
+            if format.lower() == 'png':
+                pix.save(image_path)
+            else:
+                # MuPDF only writes PNG reliably across versions; encode other formats with Pillow
+                from PIL import Image
+                image = Image.frombytes("RGBA" if pix.alpha else "RGB", (pix.width, pix.height), pix.samples)
+                _save_image(image, image_path, format)
+            image_paths.append(image_path)
+    
+    return image_paths
+
+def _render_with_pdf2image(pdf_path, output_dir, format, dpi, slide_filter):
+    """Render PDF pages to images with pdf2image (poppler), saving them in parallel.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory to save the images
+        format (str): Image format
+        dpi (int): Image resolution
+        slide_filter (set): Set of slide numbers to extract (1-based), or None for all slides
+        
+    Returns:
+        list: List of paths to the generated images
+    """
+    # Import here to avoid slowing down the script if not needed
+    from pdf2image import convert_from_path
+    
+    # Pages are rasterized and saved in parallel
+    thread_count = _conversion_threads()
+    logger.info("Rendering on %d threads", thread_count)
+    
+    # Convert PDF to images, with optional page filtering
+    if slide_filter:
+        # Convert only specific pages (1-based indexing)
+        images = convert_from_path(
+            pdf_path, 
+            dpi=dpi,
+            first_page=min(slide_filter),
+            last_page=max(slide_filter),
+            thread_count=thread_count
+        )
+        # Filter to only requested slides
+        filtered_images = []
+        for i, image in enumerate(images):
+            page_num = min(slide_filter) + i
+            if page_num in slide_filter:
+                filtered_images.append(image)
+        images = filtered_images
+    else:
+        # Convert all pages
+        images = convert_from_path(
+            pdf_path, 
+            dpi=dpi,
+            thread_count=thread_count
+        )
+    
+    logger.info("Generated %d images, now saving to disk...", len(images))
+    
+    # Calculate actual slide numbers based on filter
+    if slide_filter:
+        slide_numbers = sorted(slide_filter)
+    else:
+        slide_numbers = range(1, len(images) + 1)
+    output_path = Path(output_dir)
+    image_paths = [str(output_path / f"slide_{slide_num}.{format}")
+                   for slide_num in slide_numbers[:len(images)]]
+    
+    # Save images in parallel; encoding releases the GIL
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        return list(executor.map(_save_image, images, image_paths, [format] * len(images)))
+
 def convert_pdf_to_images(pdf_path, output_dir, format='png', dpi=300, slide_filter=None):
-    """Convert PDF file to images using pdf2image.
+    """Convert PDF file to images using PyMuPDF, or pdf2image if it is not installed.
     
     Args:
         pdf_path (str): Path to the PDF file
@@ -177,119 +343,29 @@ def convert_pdf_to_images(pdf_path, output_dir, format='png', dpi=300, slide_fil
     """
     try:
         import time
-        import threading
-        import sys
-        
-        logger.info(f"Starting PDF to image conversion for {pdf_path}")
-        logger.info(f"This process may take several minutes for large presentations...")
-        
-        # Get the number of pages in the PDF (to provide progress updates)
-        try:
-            import fitz  # PyMuPDF
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-            doc.close()
-            logger.info(f"Found {total_pages} pages in the PDF to convert")
-        except ImportError:
-            logger.info("PyMuPDF not installed, cannot determine page count in advance")
-            total_pages = None
-        except Exception as e:
-            logger.warning(f"Could not determine PDF page count: {e}")
-            total_pages = None
         
-        # Set up a progress reporting thread
-        stop_progress_thread = threading.Event()
+        logger.info("Starting PDF to image conversion for %s", pdf_path)
+        logger.info("This process may take several minutes for large presentations...")
         
-        def progress_reporter():
-            progress_counter = 0
-            while not stop_progress_thread.is_set():
-                progress_counter += 1
-                logger.info(f"PDF to image conversion in progress... ({progress_counter * 5} seconds elapsed)")
-                time.sleep(5)
-        
-        # Start progress reporting thread
-        progress_thread = threading.Thread(target=progress_reporter)
-        progress_thread.daemon = True
-        progress_thread.start()
-        
-        # Convert PDF to images with progress updates
+        # Convert PDF to images
         start_time = time.time()
         logger.info("Beginning image conversion (this is CPU-intensive and may take time)...")
         
-        try:
-            # Import here to avoid slowing down the script if not needed
-            from pdf2image import convert_from_path
-            
-            # Convert PDF to images, with optional page filtering
-            if slide_filter:
-                # Convert only specific pages (1-based indexing)
-                images = convert_from_path(
-                    pdf_path, 
-                    dpi=dpi,
-                    first_page=min(slide_filter),
-                    last_page=max(slide_filter),
-                    thread_count=1
-                )
-                # Filter to only requested slides
-                filtered_images = []
-                for i, image in enumerate(images):
-                    page_num = min(slide_filter) + i
-                    if page_num in slide_filter:
-                        filtered_images.append(image)
-                images = filtered_images
-            else:
-                # Convert all pages
-                images = convert_from_path(
-                    pdf_path, 
-                    dpi=dpi,
-                    thread_count=1
-                )
-            
-            # Stop progress reporting
-            stop_progress_thread.set()
-            progress_thread.join(timeout=1.0)
-            
-            conversion_time = time.time() - start_time
-            logger.info(f"PDF conversion completed in {conversion_time:.2f} seconds")
-            logger.info(f"Generated {len(images)} images, now saving to disk...")
-            
-            # Save images with progress updates
-            image_paths = []
-            for i, image in enumerate(images):
-                if i % 5 == 0 or i == len(images) - 1:
-                    logger.info(f"Saving image {i+1}/{len(images)}")
-                
-                # Calculate actual slide number based on filter
-                if slide_filter:
-                    slide_numbers = sorted(slide_filter)
-                    slide_num = slide_numbers[i]
-                else:
-                    slide_num = i + 1
-                
-                image_path = os.path.join(output_dir, f"slide_{slide_num}.{format}")
-                image.save(image_path, format.upper())
-                image_paths.append(image_path)
-                
-                # Provide more frequent progress updates
-                if (i+1) % 10 == 0:
-                    logger.info(f"Progress: {i+1}/{len(images)} images saved")
-            
-            total_time = time.time() - start_time
-            logger.info(f"Converted {pdf_path} to {len(image_paths)} images in {total_time:.2f} seconds")
-            return image_paths
-            
-        except Exception as e:
-            # Stop progress reporting in case of error
-            stop_progress_thread.set()
-            if progress_thread.is_alive():
-                progress_thread.join(timeout=1.0)
-            raise e
+        if PYMUPDF_AVAILABLE:
+            image_paths = _render_with_pymupdf(pdf_path, output_dir, format, dpi, slide_filter)
+        else:
+            logger.info("PyMuPDF not installed, rendering with pdf2image")
+            image_paths = _render_with_pdf2image(pdf_path, output_dir, format, dpi, slide_filter)
+        
+        total_time = time.time() - start_time
+        logger.info("Converted %s to %d images in %.2f seconds", pdf_path, len(image_paths), total_time)
+        return image_paths
             
     except ImportError:
         logger.error("pdf2image not installed. Please install it with 'pip install pdf2image'")
         return []
     except Exception as e:
-        logger.error(f"Error converting PDF to images: {e}")
+        logger.error("Error converting PDF to images: %s", e)
         return []
 
 def extract_slides(pptx_path, output_dir, format='png', dpi=300, slide_filter=None):
@@ -313,11 +389,21 @@ def extract_slides(pptx_path, output_dir, format='png', dpi=300, slide_filter=No
         logger.error("Required dependencies not found. Aborting slide extraction.")
         return []
     
-    # Extract slide titles
-    titles = extract_slide_titles(pptx_path)
+    # Open the presentation once for both the slide count and the titles; LibreOffice
+    # may still convert files python-pptx cannot read, so a failure here is not fatal
+    try:
+        prs = Presentation(pptx_path)
+    except Exception as e:
+        logger.error(f"Error extracting slide titles: {e}")
+        prs = None
     
-    # Convert PowerPoint to PDF
-    pdf_path = convert_pptx_to_pdf(pptx_path, output_dir)
+    # Extract slide titles while LibreOffice converts the PowerPoint to PDF;
+    # the two are independent and the conversion takes far longer
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pdf_future = executor.submit(convert_pptx_to_pdf, pptx_path, output_dir,
+                                     len(prs.slides) if prs is not None else "unknown number of")
+        titles = extract_slide_titles(prs) if prs is not None else []
+        pdf_path = pdf_future.result()
     if not pdf_path:
         logger.error("Failed to convert PowerPoint to PDF. Aborting slide extraction.")
         return []
@@ -334,11 +420,11 @@ def extract_slides(pptx_path, output_dir, format='png', dpi=300, slide_filter=No
         if i < len(titles):
             title = titles[i]
             sanitized_title = sanitize_filename(title)
-            new_name = f"slide_{i+1:03d}-{sanitized_title}.{format}"
-            new_path = os.path.join(output_dir, new_name)
+            new_path = output_path / f"slide_{i+1:03d}-{sanitized_title}.{format}"
             try:
-                os.rename(image_path, new_path)
-                renamed_images.append(new_path)
+                # replace() overwrites an image left over from an earlier run on every platform
+                Path(image_path).replace(new_path)
+                renamed_images.append(str(new_path))
             except Exception as e:
                 logger.error(f"Error renaming image {image_path}: {e}")
                 renamed_images.append(image_path)
@@ -347,9 +433,10 @@ def extract_slides(pptx_path, output_dir, format='png', dpi=300, slide_filter=No
     
     # Clean up the temporary PDF file
     try:
-        if os.path.exists(pdf_path):
-            os.remove(pdf_path)
-            logger.info(f"Cleaned up temporary PDF file: {pdf_path}")
+        Path(pdf_path).unlink()
+        logger.info(f"Cleaned up temporary PDF file: {pdf_path}")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not remove temporary PDF file {pdf_path}: {e}")
     
@@ -0,0 +1,72 @@
+"""
+Core slide text formatting routines.
+
+Kept free of XML and python-pptx handling, taking each slide's text as
+already extracted, so the module can be compiled ahead of time with Cython
+(see setup.py) or run as-is under PyPy.
+"""
+
+# Line prefixes treated as bullet points when converting slide text to Markdown
+_BULLETS = ('•', '-', '*')
+
+def slide_title(shape_texts):
+    """Pick a slide's title from its walked shape texts.
+    
+    Args:
+        shape_texts: (is_title_placeholder, text) pairs for the slide's top-level shapes
+        
+    Returns:
+        Slide title or "Untitled" if no title is found
+    """
+    # The title placeholder is almost always the answer
+    for is_title, text in shape_texts:
+        if is_title:
+            title = text.strip() if text else ""
+            if title:
+                return title.replace('\n', ' ')
+            break
+    
+    # Otherwise use the first shape with text
+    for _, text in shape_texts:
+        title = text.strip() if text else ""
+        if title:
+            return title.replace('\n', ' ')
+    return "Untitled"
+
+def slide_text_to_markdown(shape_texts):
+    """Format a slide's walked shape texts as Markdown.
+    
+    Args:
+        shape_texts: (is_title_placeholder, text) pairs for the slide's top-level shapes
+        
+    Returns:
+        str: All text content from the slide formatted as Markdown
+    """
+    text_content = []
+    title_found = False
+    
+    for _, shape_text in shape_texts:
+        shape_text = shape_text.strip() if shape_text else ""
+        if shape_text:
+            # Check if this might be a title (first non-empty text shape)
+            if not title_found and len(shape_text.split('\n')) == 1:
+                text_content.append(f"# {shape_text}")
+                title_found = True
+            else:
+                # Handle multi-line text content
+                lines = shape_text.split('\n')
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        # Check if line might be a bullet point
+                        if line.startswith(_BULLETS):
+                            text_content.append(f"- {line[1:].strip()}")
+                        else:
+                            text_content.append(line)
+    
+    # If no content was found, return empty string
+    if not text_content:
+        return ""
+    
+    # Join all content with appropriate spacing
+    return '\n\n'.join(text_content)
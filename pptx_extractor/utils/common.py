@@ -3,10 +3,22 @@ Common utilities for PowerPoint extraction.
 """
 
 import os
+import re
 import logging
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from ._text_core import slide_title, slide_text_to_markdown
+
+# Parse and serialize XML with lxml when available; it is much faster than the
+# stdlib parser and is what python-pptx uses, so elements from either are compatible.
+# Other modules import ET from here so the backend is chosen in one place.
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
 # Define XML namespaces used in PPTX files
 NAMESPACES = {
     'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
@@ -16,16 +28,72 @@ NAMESPACES = {
     'mc': 'http://schemas.openxmlformats.org/markup-compatibility/2006'
 }
 
+# Clark-notation prefixes ('{uri}') for building qualified tag names at import time,
+# so lookups take a literal tag instead of resolving a prefix on every call
+NS_A = f"{{{NAMESPACES['a']}}}"
+NS_P = f"{{{NAMESPACES['p']}}}"
+NS_R = f"{{{NAMESPACES['r']}}}"
+NS_P14 = f"{{{NAMESPACES['p14']}}}"
+NS_MC = f"{{{NAMESPACES['mc']}}}"
+
+# Qualified tags of the shape and text elements read from slides and notes
+TAG_P_SP = NS_P + 'sp'
+TAG_A_P = NS_A + 'p'
+TAG_A_R = NS_A + 'r'
+TAG_A_T = NS_A + 't'
+
+# Element paths and tags read when walking a slide's shape tree for text
+_SPTREE_PATH = f"{NS_P}cSld/{NS_P}spTree"
+_PH_PATH = f"*/{NS_P}nvPr/{NS_P}ph"
+_TAG_P_TXBODY = NS_P + 'txBody'
+_TAG_A_BR = NS_A + 'br'
+_TAG_A_FLD = NS_A + 'fld'
+_NON_TEXT_SHAPE_TAGS = frozenset(NS_P + tag for tag in ('grpSp', 'graphicFrame', 'cxnSp', 'pic', 'contentPart'))
+
+# Directories ensure_directory has already created or found, by path as given
+_ENSURED_DIRECTORIES = set()
+
+# Shape texts of recently walked slides, keyed by id() of the slide's XML element.
+# Each entry holds the element itself, so its id cannot be reused while cached;
+# the oldest entries are dropped beyond _SLIDE_CACHE_SIZE slides.
+_SLIDE_TEXT_CACHE = {}
+_SLIDE_CACHE_SIZE = 256
+
+# Log record formats; timestamps are only included at DEBUG level
+_LOG_FORMAT = '%(levelname)s - %(message)s'
+_DEBUG_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Characters that are invalid in Windows filenames, including the control characters.
+# A compiled character class replaces them in one scan, and was faster than a
+# str.translate table on titles, especially non-ASCII ones.
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
 def setup_logging(level=logging.INFO):
     """Set up logging configuration.
     
+    Like logging.basicConfig, this does nothing if the root logger already has
+    handlers. Timestamps are only added in debug output, where they help with
+    timing; formatting them for every record is wasted work at INFO and above.
+    Log calls on hot paths should pass arguments %-style (logger.debug('x=%s', x))
+    rather than as f-strings, so nothing is formatted for disabled levels.
+    
     Args:
         level: Logging level (default: INFO)
         
     Returns:
         Logger object
     """
-    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+    root = logging.getLogger()
+    if not root.handlers:
+        if level < logging.INFO:
+            formatter = logging.Formatter(_DEBUG_LOG_FORMAT)
+            formatter.default_msec_format = None
+        else:
+            formatter = logging.Formatter(_LOG_FORMAT)
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+        root.setLevel(level)
     return logging.getLogger(__name__)
 
 def register_namespaces():
@@ -33,17 +101,44 @@ def register_namespaces():
     for prefix, uri in NAMESPACES.items():
         ET.register_namespace(prefix, uri)
 
+def make_parser():
+    """Create an XML parser for reading package parts.
+    
+    With lxml, entity resolution and network access are disabled, which both
+    hardens parsing of untrusted files and skips that work for every entity,
+    and whitespace-only text between elements is dropped to keep trees small.
+    Text inside elements, such as a single-space <a:t>, is kept. The stdlib
+    parser never fetches external entities, so its defaults are used.
+    
+    Parsers are not safe to share between threads, so a new one is returned
+    for each call.
+    
+    Returns:
+        XMLParser for use with ET.parse(source, parser=...)
+    """
+    if LXML_AVAILABLE:
+        return ET.XMLParser(resolve_entities=False, no_network=True, remove_blank_text=True)
+    return ET.XMLParser()
+
 def ensure_directory(directory_path):
     """Ensure that a directory exists, creating it if necessary.
     
+    Each directory is only created (or checked) on the first call for it in
+    this process; later calls for the same path make no system calls.
+    
     Args:
         directory_path: Path to the directory
         
     Returns:
         Path object for the directory
     """
-    path = Path(directory_path)
+    # Use the caller's Path object as-is rather than building a copy
+    path = directory_path if isinstance(directory_path, Path) else Path(directory_path)
+    key = os.fspath(path)
+    if key in _ENSURED_DIRECTORIES:
+        return path
     path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRECTORIES.add(key)
     return path
 
 def sanitize_filename(filename):
@@ -55,13 +150,102 @@ def sanitize_filename(filename):
     Returns:
         Sanitized filename
     """
-    # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters with underscores, then limit length and trim whitespace
+    return _INVALID_FILENAME_CHARS.sub('_', filename).strip()[:100]
+
+def _shape_text(shape_elm):
+    """Get the text of a shape element, matching python-pptx's shape.text.
+    
+    Paragraphs are joined by newlines, and line breaks become vertical tabs.
+    
+    Args:
+        shape_elm: A <p:sp> element
+        
+    Returns:
+        Text of the shape's text body, or an empty string if it has none
+    """
+    tx_body = shape_elm.find(_TAG_P_TXBODY)
+    if tx_body is None:
+        return ""
+    
+    paragraphs = []
+    for para in tx_body.iterfind(TAG_A_P):
+        parts = []
+        for child in para:
+            tag = child.tag
+            if tag == _TAG_A_BR:
+                parts.append('\v')
+            elif tag == TAG_A_R or tag == _TAG_A_FLD:
+                t = child.find(TAG_A_T)
+                if t is not None and t.text:
+                    parts.append(t.text)
+        paragraphs.append(''.join(parts))
+    return '\n'.join(paragraphs)
+
+def _is_title_placeholder(shape_elm):
+    """Check whether a shape element is the placeholder python-pptx reports as slide.shapes.title.
+    
+    Args:
+        shape_elm: A shape element from the slide's shape tree
+        
+    Returns:
+        True if the shape is a placeholder with index 0
+    """
+    ph = shape_elm.find(_PH_PATH)
+    return ph is not None and int(ph.get('idx', 0)) == 0
+
+def _walk_slide_text(slide):
+    """Walk a slide's shape tree once, yielding the text of each text shape.
+    
+    Only top-level shapes are visited, in document order, as with slide.shapes.
+    Reading the XML directly avoids python-pptx's shape proxies and property
+    lookups, and never adds an empty text body to a shape the way
+    shape.text_frame does.
     
-    # Limit length and trim whitespace
-    return filename.strip()[:100]
+    Args:
+        slide: Slide object from python-pptx
+        
+    Yields:
+        (is_title_placeholder, text) for each <p:sp> element
+    """
+    sp_tree = slide.element.find(_SPTREE_PATH)
+    if sp_tree is None:
+        return
+    for shape_elm in sp_tree:
+        if shape_elm.tag == TAG_P_SP:
+            yield _is_title_placeholder(shape_elm), _shape_text(shape_elm)
+        elif shape_elm.tag in _NON_TEXT_SHAPE_TAGS and _is_title_placeholder(shape_elm):
+            # A picture or graphic frame holding the title placeholder has no text
+            yield True, None
+
+def _slide_shape_texts(slide):
+    """Get the walked shape texts of a slide, walking it only on the first request.
+    
+    The title and Markdown text of a slide are usually both needed, so the
+    second request is a dictionary lookup. Slides are assumed not to change
+    while cached; call clear_slide_caches() after editing one.
+    
+    Args:
+        slide: Slide object from python-pptx
+        
+    Returns:
+        List of (is_title_placeholder, text) pairs as yielded by _walk_slide_text
+    """
+    element = slide.element
+    key = id(element)
+    entry = _SLIDE_TEXT_CACHE.get(key)
+    if entry is not None and entry[0] is element:
+        return entry[1]
+    
+    shape_texts = list(_walk_slide_text(slide))
+    if len(_SLIDE_TEXT_CACHE) >= _SLIDE_CACHE_SIZE:
+        del _SLIDE_TEXT_CACHE[next(iter(_SLIDE_TEXT_CACHE))]
+    _SLIDE_TEXT_CACHE[key] = (element, shape_texts)
+    return shape_texts
+
+def clear_slide_caches():
+    """Forget the cached text of every slide, releasing the presentations they belong to."""
+    _SLIDE_TEXT_CACHE.clear()
 
 def get_slide_title(slide):
     """Extract the title from a slide.
@@ -72,13 +256,7 @@ def get_slide_title(slide):
     Returns:
         Slide title or "Untitled" if no title is found
     """
-    title = "Untitled"
-    for shape in slide.shapes:
-        if hasattr(shape, "text") and shape.has_text_frame:
-            if shape.text.strip():
-                title = shape.text.strip().replace('\n', ' ')
-                break
-    return title
+    return slide_title(_slide_shape_texts(slide))
 
 def get_slide_text_as_markdown(slide):
     """Extract all text content from a slide and format as Markdown.
@@ -89,32 +267,4 @@ def get_slide_text_as_markdown(slide):
     Returns:
         str: All text content from the slide formatted as Markdown
     """
-    text_content = []
-    title_found = False
-    
-    for shape in slide.shapes:
-        if hasattr(shape, "text") and shape.has_text_frame:
-            shape_text = shape.text.strip()
-            if shape_text:
-                # Check if this might be a title (first non-empty text shape)
-                if not title_found and len(shape_text.split('\n')) == 1:
-                    text_content.append(f"# {shape_text}")
-                    title_found = True
-                else:
-                    # Handle multi-line text content
-                    lines = shape_text.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            # Check if line might be a bullet point
-                            if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                                text_content.append(f"- {line[1:].strip()}")
-                            else:
-                                text_content.append(line)
-    
-    # If no content was found, return empty string
-    if not text_content:
-        return ""
-    
-    # Join all content with appropriate spacing
-    return '\n\n'.join(text_content)
+    return slide_text_to_markdown(_slide_shape_texts(slide))
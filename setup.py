@@ -8,6 +8,27 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Compile the animation parsing and slide text formatting cores ahead of time
+# when Cython is available; otherwise the pure-Python modules are used as-is.
+# The extensions are optional, so a failed C build (e.g. no compiler) only
+# warns and the install continues with the pure-Python modules.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            "pptx_extractor/animations/_anim_core.py",
+            "pptx_extractor/utils/_text_core.py",
+        ],
+        compiler_directives={"language_level": 3},
+    )
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
+except Exception as e:
+    print(f"warning: Cython could not translate the core modules ({e}); using pure-Python modules")
+    ext_modules = []
+
 setup(
     name="pptx_extractor",
     version="0.1.0",
@@ -18,6 +39,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/adbertram/powerpoint_context_extractor",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -26,9 +48,18 @@ setup(
     python_requires=">=3.6",
     install_requires=[
         "python-pptx>=0.6.21",
+        "lxml>=4.9",
         "Pillow>=9.5.0",
         "pdf2image>=1.16.3",
     ],
+    extras_require={
+        # Optional accelerators, each picked up automatically when installed
+        "fast": [
+            "PyMuPDF>=1.20.0",
+            "orjson>=3.6",
+            "h2>=4.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "pptx-extract=pptx_extract:main",
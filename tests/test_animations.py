@@ -0,0 +1,57 @@
+"""
+Tests for the layout scan shared by animation extractions.
+"""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from pptx import Presentation
+
+from pptx_extractor.animations import extractor
+from pptx_extractor.animations.extractor import extract_slide_animations
+
+
+class LayoutScanTests(unittest.TestCase):
+    """Layout scans reuse the open archive and cannot be modified through their results."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'deck.pptx')
+        prs = Presentation()
+        for layout in (0, 1, 5):
+            prs.slides.add_slide(prs.slide_layouts[layout])
+        prs.save(self.path)
+        extractor._LAYOUT_SCANS.clear()
+        self.addCleanup(extractor._LAYOUT_SCANS.clear)
+
+    def test_archive_is_opened_once_per_extraction(self):
+        # python-pptx opens the file through zipfile too; count only the extractor's opens
+        with mock.patch.object(zipfile, 'ZipFile', wraps=zipfile.ZipFile) as zip_file:
+            Presentation(self.path)
+        pptx_opens = zip_file.call_count
+
+        for _ in range(2):
+            with mock.patch.object(zipfile, 'ZipFile', wraps=zipfile.ZipFile) as zip_file:
+                extract_slide_animations(self.path)
+            self.assertEqual(zip_file.call_count - pptx_opens, 1)
+
+    def test_scan_is_reused_and_not_shared(self):
+        with zipfile.ZipFile(self.path) as pptx_zip:
+            names = set(pptx_zip.namelist())
+            animations_by_layout, slide_layouts = extractor._cached_scan_layouts(self.path, pptx_zip, names)
+            self.assertEqual(set(slide_layouts), {1, 2, 3})
+            animations_by_layout['layout_1'] = True
+            slide_layouts.clear()
+            with mock.patch.object(extractor, '_scan_layouts') as scan:
+                again = extractor._cached_scan_layouts(self.path, pptx_zip, names)
+        scan.assert_not_called()
+        self.assertNotIn('layout_1', again[0])
+        self.assertEqual(set(again[1]), {1, 2, 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests for sending Anthropic recommendation requests as one Message Batches request.
+"""
+
+import itertools
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from pptx_extractor.recommendations import generator
+from pptx_extractor.recommendations.generator import Slide, _generate_all_anthropic_batch
+
+
+def _succeeded(custom_id, text):
+    """Build a succeeded batch result."""
+    message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+    return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type='succeeded', message=message))
+
+
+def _failed(custom_id, result_type):
+    """Build an errored, expired or canceled batch result."""
+    return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type=result_type))
+
+
+class _FakeBatches:
+    """Stand-in for client.messages.batches that ends after a number of polls."""
+
+    def __init__(self, results, polls_until_ended=1):
+        self.results_list = results
+        self.polls_until_ended = polls_until_ended
+        self.requests = None
+        self.cancelled = []
+
+    def _batch(self):
+        status = 'ended' if self.polls_until_ended <= 0 else 'in_progress'
+        return SimpleNamespace(id='batch_1', processing_status=status)
+
+    def create(self, requests):
+        self.requests = requests
+        return self._batch()
+
+    def retrieve(self, batch_id):
+        self.polls_until_ended -= 1
+        return self._batch()
+
+    def results(self, batch_id):
+        return iter(self.results_list)
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+
+def _slides(count):
+    """Build titled slides."""
+    return [Slide.from_dict({"number": i, "title": f"Slide title {i}"}) for i in range(1, count + 1)]
+
+
+class BatchTests(unittest.TestCase):
+    """Mapping batch results back to slides, and giving up on batches."""
+
+    def setUp(self):
+        patch = mock.patch.object(generator.time, 'sleep')
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _run(self, batches, slides):
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        with mock.patch.object(generator, '_get_client', return_value=client):
+            return _generate_all_anthropic_batch(slides, "key", "text")
+
+    def test_results_are_mapped_by_custom_id(self):
+        # Results come back in any order
+        batches = _FakeBatches([
+            _succeeded('slide_2', "Third.\n\nSecond paragraph."),
+            _failed('slide_1', 'errored'),
+            _succeeded('slide_0', "First."),
+        ])
+        recommendations = self._run(batches, _slides(4))
+
+        self.assertEqual([request['custom_id'] for request in batches.requests],
+                         ['slide_0', 'slide_1', 'slide_2', 'slide_3'])
+        self.assertEqual(recommendations, [
+            "First.",
+            "Error generating recommendation: batch request errored",
+            "Third.",
+            "Error generating recommendation: no batch result",
+        ])
+        self.assertEqual(batches.cancelled, [])
+
+    def test_timeout_cancels_the_batch(self):
+        batches = _FakeBatches([], polls_until_ended=100)
+        clock = itertools.count(0, 1000)
+        with mock.patch.object(generator.time, 'monotonic', side_effect=lambda: float(next(clock))):
+            with self.assertRaises(TimeoutError):
+                self._run(batches, _slides(2))
+        self.assertEqual(batches.cancelled, ['batch_1'])
+
+    def test_interrupt_cancels_the_batch(self):
+        batches = _FakeBatches([], polls_until_ended=100)
+        generator.time.sleep.side_effect = KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self._run(batches, _slides(2))
+        self.assertEqual(batches.cancelled, ['batch_1'])
+
+    def test_timeout_falls_back_to_individual_requests(self):
+        batches = _FakeBatches([], polls_until_ended=100)
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        slides_data = {"slides": [{"number": i, "title": f"Slide title {i}"} for i in range(1, 7)]}
+        individual = mock.AsyncMock(side_effect=lambda slides, *args: [f"Individual {s.number}" for s in slides])
+        clock = itertools.count(0, 1000)
+
+        with mock.patch.object(generator, '_lazy_anthropic', return_value=object()), \
+                mock.patch.object(generator, '_get_client', return_value=client), \
+                mock.patch.object(generator, '_generate_all_anthropic_async', individual), \
+                mock.patch.object(generator.time, 'monotonic', side_effect=lambda: float(next(clock))):
+            generator.generate_all_recommendations(slides_data, "key", use_cache=False, use_batch=True)
+
+        self.assertEqual(batches.cancelled, ['batch_1'])
+        individual.assert_called_once()
+        self.assertEqual([slide['recommended_usage'] for slide in slides_data['slides']],
+                         [f"Individual {i}" for i in range(1, 7)])
+
+
+if __name__ == "__main__":
+    unittest.main()
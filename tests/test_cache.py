@@ -0,0 +1,130 @@
+"""
+Tests for the persistent recommendation cache.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pptx_extractor.recommendations import cache, generator
+from pptx_extractor.recommendations.cache import SemanticCache
+from pptx_extractor.recommendations.generator import Slide
+
+
+class SemanticCacheTests(unittest.TestCase):
+    """Exact lookups against a database in a temporary directory."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'cache' / 'llm_cache.sqlite'
+        self.cache = SemanticCache(self.path, ttl_seconds=60)
+        self.addCleanup(self.cache.close)
+
+    def test_exact_hit_and_miss(self):
+        self.cache.set("scope", "Slide 1: Revenue", "Use it to report revenue.")
+        self.assertTrue(self.path.exists())
+        self.assertEqual(self.cache.get("scope", "Slide 1: Revenue"), "Use it to report revenue.")
+        self.assertIsNone(self.cache.get("scope", "Slide 1: Costs"))
+
+    def test_entries_persist_across_instances(self):
+        self.cache.set("scope", "text", "response")
+        reopened = SemanticCache(self.path, ttl_seconds=60)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get("scope", "text"), "response")
+
+    def test_scopes_are_isolated(self):
+        self.cache.set("anthropic\nmodel-a\nprompt", "text", "response")
+        self.assertIsNone(self.cache.get("anthropic\nmodel-b\nprompt", "text"))
+        self.assertIsNone(self.cache.get("anthropic\nmodel-a\nother prompt", "text"))
+
+    def test_expired_entries_miss(self):
+        with mock.patch.object(cache.time, 'time', return_value=1000.0):
+            self.cache.set("scope", "text", "response")
+        with mock.patch.object(cache.time, 'time', return_value=1059.0):
+            self.assertEqual(self.cache.get("scope", "text"), "response")
+        with mock.patch.object(cache.time, 'time', return_value=1061.0):
+            self.assertIsNone(self.cache.get("scope", "text"))
+
+    def test_unopenable_database_always_misses(self):
+        # The database's parent directory is a file, so it cannot be created
+        blocker = self.path.parent / 'not_a_directory'
+        blocker.parent.mkdir(parents=True, exist_ok=True)
+        blocker.write_text("")
+        broken = SemanticCache(blocker / 'llm_cache.sqlite')
+        self.assertIsNone(broken._conn)
+        broken.set("scope", "text", "response")
+        self.assertIsNone(broken.get("scope", "text"))
+
+
+class RecommendationCachingTests(unittest.TestCase):
+    """How generate_recommendation uses the cache."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = SemanticCache(Path(directory.name) / 'llm_cache.sqlite')
+        self.addCleanup(self.cache.close)
+        patch = mock.patch.object(generator, '_get_cache', return_value=self.cache)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.slide = Slide.from_dict({"number": 2, "title": "Quarterly revenue"})
+
+    def _generate(self, recommendation):
+        with mock.patch.object(generator, 'generate_anthropic_recommendation',
+                               return_value=recommendation) as generate:
+            result = generator.generate_recommendation(self.slide, "key")
+        return result, generate.call_count
+
+    def test_recommendations_are_reused(self):
+        self.assertEqual(self._generate("Use it to report revenue."), ("Use it to report revenue.", 1))
+        self.assertEqual(self._generate("Something else."), ("Use it to report revenue.", 0))
+
+    def test_failures_are_not_stored(self):
+        for failure in ("Error generating recommendation: overloaded",
+                        "Recommendation generation unavailable: Anthropic library not installed"):
+            self.assertEqual(self._generate(failure), (failure, 1))
+        self.assertEqual(self._generate("Use it to report revenue."), ("Use it to report revenue.", 1))
+
+    def test_scope_changes_with_model_and_system_message(self):
+        scope = generator._cache_scope(self.slide, "anthropic", "text")
+        config = mock.Mock()
+        config.get_api_config.return_value = {'model': 'another-model'}
+        with mock.patch.object(generator, 'get_config', return_value=config):
+            self.assertNotEqual(generator._cache_scope(self.slide, "anthropic", "text"), scope)
+        with mock.patch.object(generator, 'load_system_message', return_value="Another prompt"):
+            self.assertNotEqual(generator._cache_scope(self.slide, "anthropic", "text"), scope)
+
+
+class CachePathTests(unittest.TestCase):
+    """The shared cache's location comes from processing.recommendations.cache.path."""
+
+    def tearDown(self):
+        generator._get_cache.cache_clear()
+
+    def test_configured_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'custom.sqlite'
+            config = mock.Mock()
+            config.get.return_value = {'path': str(path)}
+            generator._get_cache.cache_clear()
+            with mock.patch.object(generator, 'get_config', return_value=config):
+                shared = generator._get_cache()
+            shared.close()
+            self.assertEqual(shared._path, path)
+            self.assertTrue(path.exists())
+
+    def test_default_path(self):
+        config = mock.Mock()
+        config.get.return_value = {}
+        generator._get_cache.cache_clear()
+        with mock.patch.object(generator, 'get_config', return_value=config), \
+                mock.patch.object(cache.sqlite3, 'connect', side_effect=cache.sqlite3.Error("not opened")), \
+                mock.patch.object(Path, 'mkdir'):
+            shared = generator._get_cache()
+        self.assertEqual(shared._path, cache.DEFAULT_CACHE_PATH)
+
+
+if __name__ == "__main__":
+    unittest.main()
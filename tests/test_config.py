@@ -0,0 +1,91 @@
+"""
+Tests for configuration loading and dotted-path access.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from pptx_extractor.config import Config, _resolve_config_path
+
+
+class ConfigPathTests(unittest.TestCase):
+    """Resolved configuration paths survive a change of working directory."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name).resolve()
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(_resolve_config_path.cache_clear)
+        _resolve_config_path.cache_clear()
+
+    def _write_config(self, directory, dpi):
+        directory.mkdir(exist_ok=True)
+        (directory / 'config.json').write_text(json.dumps({'processing': {'image_dpi': dpi}}))
+
+    def test_explicit_relative_path_is_absolute(self):
+        self._write_config(self.directory / 'first', 100)
+        os.chdir(self.directory / 'first')
+        path = _resolve_config_path('config.json')
+        self.assertEqual(path, self.directory / 'first' / 'config.json')
+
+        self._write_config(self.directory / 'second', 200)
+        os.chdir(self.directory / 'second')
+        self.assertEqual(Config('config.json').get('processing.image_dpi'), 100)
+
+    def test_searched_path_is_absolute(self):
+        self._write_config(self.directory / 'first', 100)
+        os.chdir(self.directory / 'first')
+        self.assertEqual(_resolve_config_path(None), self.directory / 'first' / 'config.json')
+
+        os.chdir(self.directory)
+        self.assertEqual(Config().get('processing.image_dpi'), 100)
+
+
+class ConfigAccessTests(unittest.TestCase):
+    """Dotted-path get and set agree with each other."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / 'config.json'
+        path.write_text(json.dumps({
+            'processing': {'image_dpi': 300, 'recommendations': {'cache': {'ttl_days': 30}}},
+            'supported_formats': {'image': ['png', 'jpg']},
+        }))
+        self.config = Config(str(path))
+
+    def test_get_set_round_trip(self):
+        self.config.set('processing.image_dpi', 150)
+        self.assertEqual(self.config.get('processing.image_dpi'), 150)
+        self.assertEqual(self.config.get('processing')['image_dpi'], 150)
+
+        self.config.set('processing.recommendations.cache', {'ttl_days': 7})
+        self.assertEqual(self.config.get('processing.recommendations.cache.ttl_days'), 7)
+        self.assertEqual(self.config.get('processing.recommendations'), {'cache': {'ttl_days': 7}})
+
+        self.config.set('new_section.value', 1)
+        self.assertEqual(self.config.get('new_section'), {'value': 1})
+
+    def test_sections_are_copies(self):
+        self.config.get('processing')['image_dpi'] = 1
+        self.config.get('processing.recommendations.cache')['ttl_days'] = 1
+        self.config.get('supported_formats.image').append('bmp')
+
+        self.assertEqual(self.config.get('processing.image_dpi'), 300)
+        self.assertEqual(self.config.get('processing')['image_dpi'], 300)
+        self.assertEqual(self.config.get('processing.recommendations.cache.ttl_days'), 30)
+        self.assertEqual(self.config.get('supported_formats.image'), ['png', 'jpg'])
+
+    def test_missing_keys_return_default(self):
+        default = {}
+        self.assertIs(self.config.get('processing.missing', default), default)
+        self.assertIsNone(self.config.get('missing.section'))
+
+
+if __name__ == "__main__":
+    unittest.main()
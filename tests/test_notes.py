@@ -0,0 +1,100 @@
+"""
+Tests for streaming notes text out of the notes slide parts.
+"""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from pptx import Presentation
+
+from pptx_extractor.notes import extractor
+from pptx_extractor.notes.extractor import _find_notes_text, extract_notes_from_xml, extract_slide_notes
+
+# Long enough to span several of the parser's 64KB feed chunks
+_LONG_NOTES = ' '.join(f"word{i}" for i in range(40000))
+
+_MULTI_PARAGRAPH_NOTES = ["First paragraph of the notes.", "Second paragraph.", "Third paragraph."]
+
+
+def _save_deck(path, slide_count=10):
+    """
+    Save a deck whose first slide has long notes, whose second has several
+    paragraphs of notes, whose last has no notes slide and whose others have short notes.
+    """
+    prs = Presentation()
+    for i in range(1, slide_count + 1):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i}"
+        if i == slide_count:
+            continue
+        notes = slide.notes_slide.notes_text_frame
+        if i == 1:
+            notes.text = _LONG_NOTES
+        elif i == 2:
+            notes.text = _MULTI_PARAGRAPH_NOTES[0]
+            for text in _MULTI_PARAGRAPH_NOTES[1:]:
+                notes.add_paragraph().text = text
+        else:
+            notes.text = f"Notes for slide {i}"
+    prs.save(path)
+
+
+class NotesExtractionTests(unittest.TestCase):
+    """Notes read from the XML match what python-pptx reads."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'notes.pptx')
+        _save_deck(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_long_notes_span_feed_chunks(self):
+        with zipfile.ZipFile(self.path) as pptx_zip:
+            xml = pptx_zip.read('ppt/notesSlides/notesSlide1.xml')
+        self.assertGreater(len(xml), 2 * extractor._FEED_SIZE)
+        self.assertEqual(extract_notes_from_xml(self.path)[1], _LONG_NOTES)
+
+    def test_chunk_boundaries_anywhere(self):
+        with zipfile.ZipFile(self.path) as pptx_zip:
+            xml = pptx_zip.read('ppt/notesSlides/notesSlide2.xml')
+        for size in (1, 7, 64, 1000):
+            chunks = (xml[k:k + size] for k in range(0, len(xml), size))
+            self.assertEqual(_find_notes_text(chunks), '\n'.join(_MULTI_PARAGRAPH_NOTES), size)
+
+    def test_multi_paragraph_notes(self):
+        self.assertEqual(extract_notes_from_xml(self.path)[2], '\n'.join(_MULTI_PARAGRAPH_NOTES))
+
+    def test_matches_python_pptx(self):
+        xml_notes = extract_notes_from_xml(self.path)
+        for i, slide in enumerate(Presentation(self.path).slides, 1):
+            expected = slide.notes_slide.notes_text_frame.text if slide.has_notes_slide else None
+            self.assertEqual(xml_notes.get(i), expected, i)
+
+    def test_slide_without_notes_slide(self):
+        self.assertNotIn(10, extract_notes_from_xml(self.path))
+        notes_data = extract_slide_notes(self.path)
+        self.assertEqual(notes_data['slide_10']['notes'], "")
+        self.assertEqual(notes_data['slide_3']['notes'], "Notes for slide 3")
+
+    def test_slide_filter(self):
+        self.assertEqual(extract_notes_from_xml(self.path, {3, 4}),
+                         {3: "Notes for slide 3", 4: "Notes for slide 4"})
+
+    def test_falls_back_to_python_pptx(self):
+        with mock.patch.object(extractor, '_find_notes_text', side_effect=ValueError("unparseable")), \
+                self.assertLogs(extractor.logger, level='ERROR'):
+            notes_data = extract_slide_notes(self.path)
+        self.assertEqual(notes_data['slide_2']['notes'], '\n'.join(_MULTI_PARAGRAPH_NOTES))
+        self.assertEqual(notes_data['slide_3']['notes'], "Notes for slide 3")
+        self.assertEqual(notes_data['slide_10']['notes'], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for skipping recommendation requests for slides without content.
+"""
+
+import sys
+import unittest
+from unittest import mock
+
+from pptx_extractor.recommendations import generator
+from pptx_extractor.recommendations.generator import Slide, _is_degenerate
+
+
+def _slide_dict(number, title="", text="", notes="", animation_sequence=None):
+    """Build a slide dictionary the way pptx_extract.py does."""
+    return {
+        "number": number,
+        "title": title,
+        "text": text,
+        "notes": notes,
+        "animation_sequence": animation_sequence or [],
+        "image_path": "",
+    }
+
+
+class DegenerateSlideTests(unittest.TestCase):
+    """Which slides are answered without an API call."""
+
+    def test_titled_slide_without_notes_is_not_degenerate(self):
+        slide = Slide.from_dict(_slide_dict(5, title="Quarterly revenue"))
+        self.assertFalse(_is_degenerate(slide))
+
+    def test_slide_with_body_text_and_animation_is_not_degenerate(self):
+        slide = Slide.from_dict(_slide_dict(
+            5, title="Quarterly revenue", text="- Up 12%\n\n- Ahead of plan",
+            animation_sequence=[{"description": "Fade in"}]))
+        self.assertFalse(_is_degenerate(slide))
+
+    def test_untitled_slide_with_only_body_text_is_not_degenerate(self):
+        slide = Slide.from_dict(_slide_dict(3, title="Untitled", text="Some body text"))
+        self.assertFalse(_is_degenerate(slide))
+
+    def test_blank_slide_is_degenerate(self):
+        self.assertTrue(_is_degenerate(Slide.from_dict(_slide_dict(3))))
+        self.assertTrue(_is_degenerate(Slide.from_dict(_slide_dict(3, title="Untitled"))))
+
+    def test_titled_slide_without_notes_is_sent_to_the_llm(self):
+        slides_data = {"slides": [_slide_dict(2, title="Quarterly revenue"), _slide_dict(3)]}
+        with mock.patch.object(generator, "_lazy_anthropic", return_value=None), \
+                mock.patch.object(generator, "generate_recommendation",
+                                  return_value="Use it to report revenue.") as generate:
+            generator.generate_all_recommendations(slides_data, "key", use_cache=False)
+
+        generate.assert_called_once()
+        self.assertEqual(generate.call_args[0][0].title, "Quarterly revenue")
+        self.assertEqual(slides_data["slides"][0]["recommended_usage"], "Use it to report revenue.")
+        self.assertEqual(slides_data["slides"][1]["recommended_usage"],
+                         generator._CLOSING_SLIDE_RECOMMENDATION)
+
+
+class LazyAnthropicTests(unittest.TestCase):
+    """The Anthropic SDK is imported, or found missing, once."""
+
+    def setUp(self):
+        generator._lazy_anthropic.cache_clear()
+        self.addCleanup(generator._lazy_anthropic.cache_clear)
+
+    def test_missing_sdk_is_reported_once(self):
+        slides_data = {"slides": [_slide_dict(i, title=f"Slide title {i}") for i in range(1, 7)]}
+        with mock.patch.dict(sys.modules, {"anthropic": None}), \
+                self.assertLogs(generator.logger, level="WARNING") as logs:
+            generator.generate_all_recommendations(slides_data, "key", use_cache=False, use_batch=True)
+            generator.generate_all_recommendations(slides_data, "key", use_cache=False)
+
+        warnings = [line for line in logs.output if "Anthropic library not installed" in line]
+        self.assertEqual(len(warnings), 1)
+        self.assertFalse(generator.ANTHROPIC_AVAILABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for retrying provider requests and the per-provider circuit breaker.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from pptx_extractor.recommendations import generator
+from pptx_extractor.recommendations.generator import (
+    _CircuitBreaker, _call_with_retries, _is_transient, _retry_delay)
+
+
+class _StatusError(Exception):
+    """Provider error carrying an HTTP status, like the Anthropic SDK's."""
+
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        headers = {'retry-after': retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class _FakeCall:
+    """Request function raising the given errors in turn, then returning "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TransientTests(unittest.TestCase):
+    """Which errors are worth retrying."""
+
+    def test_transient_statuses(self):
+        for status in (408, 429, 500, 503, 529):
+            self.assertTrue(_is_transient(_StatusError(status)), status)
+
+    def test_client_errors_are_not_transient(self):
+        for status in (400, 401, 404, 413):
+            self.assertFalse(_is_transient(_StatusError(status)), status)
+
+    def test_connection_errors_are_transient(self):
+        self.assertTrue(_is_transient(ConnectionError()))
+        self.assertTrue(_is_transient(TimeoutError()))
+        self.assertFalse(_is_transient(ValueError()))
+
+
+class RetryDelayTests(unittest.TestCase):
+    """How long to wait between attempts."""
+
+    def test_retry_after_is_used(self):
+        self.assertEqual(_retry_delay(0, _StatusError(429, retry_after="2")), 2.0)
+
+    def test_retry_after_is_capped(self):
+        self.assertEqual(_retry_delay(0, _StatusError(429, retry_after="3600")), generator._RETRY_MAX_SECONDS)
+
+    def test_backoff_is_bounded(self):
+        for attempt in range(10):
+            delay = _retry_delay(attempt, _StatusError(503))
+            self.assertGreaterEqual(delay, generator._RETRY_MIN_SECONDS)
+            self.assertLessEqual(delay, generator._RETRY_MAX_SECONDS)
+
+
+class CallWithRetriesTests(unittest.TestCase):
+    """Retrying requests and feeding the circuit breaker."""
+
+    def setUp(self):
+        self.breaker = _CircuitBreaker('test', threshold=2, cooldown_seconds=60)
+        patches = [
+            mock.patch.dict(generator._BREAKERS, {'test': self.breaker}),
+            mock.patch.object(generator, '_retry_attempts', return_value=2),
+            mock.patch.object(generator.time, 'sleep'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_transient_failure_is_retried(self):
+        call = _FakeCall(_StatusError(529))
+        self.assertEqual(_call_with_retries('test', call), "ok")
+        self.assertEqual(call.calls, 2)
+        generator.time.sleep.assert_called_once()
+
+    def test_retries_stop_at_retry_attempts(self):
+        call = _FakeCall(*[_StatusError(503)] * 5)
+        with self.assertRaises(_StatusError):
+            _call_with_retries('test', call)
+        self.assertEqual(call.calls, 3)
+        self.assertEqual(self.breaker._failures, 1)
+
+    def test_non_transient_failure_is_not_retried_or_counted(self):
+        for _ in range(5):
+            call = _FakeCall(_StatusError(400))
+            with self.assertRaises(_StatusError):
+                _call_with_retries('test', call)
+            self.assertEqual(call.calls, 1)
+        self.assertEqual(self.breaker._failures, 0)
+        self.assertEqual(_call_with_retries('test', _FakeCall()), "ok")
+
+    def test_breaker_opens_and_closes_after_cooldown(self):
+        with mock.patch.object(generator.time, 'monotonic', return_value=1000.0):
+            for _ in range(2):
+                with self.assertRaises(_StatusError):
+                    _call_with_retries('test', _FakeCall(*[_StatusError(503)] * 3))
+            call = _FakeCall()
+            with self.assertRaises(RuntimeError):
+                _call_with_retries('test', call)
+            self.assertEqual(call.calls, 0)
+
+        with mock.patch.object(generator.time, 'monotonic', return_value=1061.0):
+            self.assertEqual(_call_with_retries('test', _FakeCall()), "ok")
+
+
+class RetryAttemptsConfigTests(unittest.TestCase):
+    """The number of retries comes from error_handling.retry_attempts."""
+
+    def test_retries_follow_config(self):
+        config = mock.Mock()
+        config.get.return_value = 1
+        breaker = _CircuitBreaker('test')
+        with mock.patch.object(generator, 'get_config', return_value=config), \
+                mock.patch.dict(generator._BREAKERS, {'test': breaker}), \
+                mock.patch.object(generator.time, 'sleep'):
+            call = _FakeCall(*[_StatusError(503)] * 5)
+            with self.assertRaises(_StatusError):
+                _call_with_retries('test', call)
+        config.get.assert_called_with('error_handling.retry_attempts', 4)
+        self.assertEqual(call.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
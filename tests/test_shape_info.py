@@ -0,0 +1,98 @@
+"""
+Tests that animated shape information read from the slide XML matches python-pptx.
+"""
+
+import io
+import unittest
+
+from PIL import Image
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.util import Inches
+
+from pptx_extractor.animations.extractor import _build_shape_info, _xml_shape_text, _xml_shape_type
+
+
+def _png():
+    """Get a small PNG image as a file-like object."""
+    image = io.BytesIO()
+    Image.new('RGB', (8, 8), 'red').save(image, format='PNG')
+    image.seek(0)
+    return image
+
+
+def _build_deck():
+    """Build a presentation with one slide holding every common kind of shape."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "First line\vSecond line"
+    slide.placeholders[1].text_frame.text = "Body paragraph one"
+    slide.placeholders[1].text_frame.add_paragraph().text = "Body paragraph two"
+
+    shapes = slide.shapes
+    shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "Text box"
+    shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1), Inches(2), Inches(2), Inches(1)).text = "Auto shape"
+    shapes.add_shape(MSO_SHAPE.OVAL, Inches(1), Inches(3), Inches(1), Inches(1))
+    shapes.add_picture(_png(), Inches(4), Inches(1))
+    shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(0), Inches(0), Inches(1), Inches(1))
+
+    table = shapes.add_table(2, 2, Inches(4), Inches(3), Inches(3), Inches(1)).table
+    table.cell(0, 0).text = "Cell"
+
+    chart_data = CategoryChartData()
+    chart_data.categories = ['A', 'B']
+    chart_data.add_series('Series', (1, 2))
+    shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(6), Inches(4), Inches(2), Inches(2), chart_data)
+
+    group = shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(6), Inches(1), Inches(1), Inches(1)).text_frame.text = "Grouped"
+
+    freeform = shapes.build_freeform(Inches(7), Inches(2))
+    freeform.add_line_segments([(Inches(8), Inches(2)), (Inches(8), Inches(3))])
+    freeform.convert_to_shape()
+
+    # Save and reopen so the shapes are read back the way the extractor sees them
+    stream = io.BytesIO()
+    prs.save(stream)
+    stream.seek(0)
+    return Presentation(stream).slides[0]
+
+
+class ShapeInfoParityTests(unittest.TestCase):
+    """The XML readers agree with python-pptx's shape_type and text."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.slide = _build_deck()
+
+    def test_shape_type_matches_python_pptx(self):
+        for shape in self.slide.shapes:
+            with self.subTest(shape=shape.name):
+                self.assertEqual(_xml_shape_type(shape.element), str(shape.shape_type))
+
+    def test_shape_text_matches_python_pptx(self):
+        for shape in self.slide.shapes:
+            if shape.has_text_frame:
+                with self.subTest(shape=shape.name):
+                    self.assertEqual(_xml_shape_text(shape.element), shape.text)
+
+    def test_title_line_break(self):
+        self.assertEqual(_xml_shape_text(self.slide.shapes.title.element), "First line\vSecond line")
+
+    def test_build_shape_info_matches_python_pptx(self):
+        expected = {}
+        for shape in self.slide.shapes:
+            text = shape.text.strip() if shape.has_text_frame else ""
+            expected[str(shape.shape_id)] = {'type': str(shape.shape_type), 'text': text}
+
+        self.assertEqual(_build_shape_info(self.slide, set(expected)), expected)
+
+    def test_build_shape_info_only_collects_requested_shapes(self):
+        shape_id = str(self.slide.shapes.title.shape_id)
+        self.assertEqual(list(_build_shape_info(self.slide, {shape_id})), [shape_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
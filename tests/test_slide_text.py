@@ -0,0 +1,127 @@
+"""
+Tests that slide titles and Markdown text read from the shape tree XML match python-pptx.
+"""
+
+import io
+import unittest
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches
+
+from pptx_extractor.utils.common import clear_slide_caches, get_slide_text_as_markdown, get_slide_title
+
+
+def _reference_title(slide):
+    """Get a slide's title through python-pptx's shape objects."""
+    title_shape = slide.shapes.title
+    if title_shape is not None and title_shape.has_text_frame:
+        title = title_shape.text_frame.text.strip()
+        if title:
+            return title.replace('\n', ' ')
+    for shape in slide.shapes:
+        if shape.has_text_frame and shape.text.strip():
+            return shape.text.strip().replace('\n', ' ')
+    return "Untitled"
+
+
+def _reference_markdown(slide):
+    """Get a slide's Markdown text through python-pptx's shape objects."""
+    text_content = []
+    title_found = False
+    for shape in slide.shapes:
+        if not shape.has_text_frame:
+            continue
+        shape_text = shape.text.strip()
+        if not shape_text:
+            continue
+        if not title_found and len(shape_text.split('\n')) == 1:
+            text_content.append(f"# {shape_text}")
+            title_found = True
+            continue
+        for line in shape_text.split('\n'):
+            line = line.strip()
+            if line:
+                text_content.append(f"- {line[1:].strip()}" if line.startswith(('•', '-', '*')) else line)
+    return '\n\n'.join(text_content)
+
+
+def _build_slides():
+    """Build slides covering groups, tables, placeholder-less slides and line breaks."""
+    prs = Presentation()
+    box = (Inches(1), Inches(1), Inches(3), Inches(1))
+
+    # Title with a line break, and bulleted body text
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Quarterly\vrevenue"
+    body = slide.placeholders[1].text_frame
+    body.text = "• Up 12%"
+    body.add_paragraph().text = "- Ahead of plan"
+    body.add_paragraph().text = "Line one\vline two"
+
+    # No placeholders: text boxes, an auto shape, a group and a table
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(*box).text_frame.text = "Inside a group"
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(3), Inches(1)).table
+    table.cell(0, 0).text = "Table cell"
+    slide.shapes.add_textbox(*box).text_frame.text = "First text box\nsecond paragraph"
+    slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, *box).text = "Auto shape"
+    slide.shapes.add_textbox(*box)
+
+    # Title placeholder after another text shape in document order
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = "Real title"
+    slide.shapes.add_textbox(*box).text_frame.text = "Caption"
+    sp_tree = slide.shapes._spTree
+    title_element = slide.shapes.title.element
+    sp_tree.remove(title_element)
+    sp_tree.append(title_element)
+
+    # Empty title placeholder, so the first shape with text is used
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.placeholders[1].text_frame.text = "Body only"
+
+    # Nothing but a group and a table
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_group_shape().shapes.add_textbox(*box).text_frame.text = "Grouped"
+    slide.shapes.add_table(1, 1, *box).table.cell(0, 0).text = "Cell"
+
+    stream = io.BytesIO()
+    prs.save(stream)
+    stream.seek(0)
+    return list(Presentation(stream).slides)
+
+
+class SlideTextParityTests(unittest.TestCase):
+    """get_slide_title and get_slide_text_as_markdown agree with python-pptx."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.slides = _build_slides()
+
+    def tearDown(self):
+        clear_slide_caches()
+
+    def test_titles_match_python_pptx(self):
+        for number, slide in enumerate(self.slides, 1):
+            self.assertEqual(get_slide_title(slide), _reference_title(slide), number)
+
+    def test_markdown_matches_python_pptx(self):
+        for number, slide in enumerate(self.slides, 1):
+            self.assertEqual(get_slide_text_as_markdown(slide), _reference_markdown(slide), number)
+
+    def test_expected_titles(self):
+        self.assertEqual([get_slide_title(slide) for slide in self.slides],
+                         ["Quarterly\vrevenue", "First text box second paragraph", "Real title",
+                          "Body only", "Untitled"])
+
+    def test_group_and_table_text_is_not_included(self):
+        markdown = get_slide_text_as_markdown(self.slides[1])
+        self.assertNotIn("Inside a group", markdown)
+        self.assertNotIn("Table cell", markdown)
+        self.assertEqual(get_slide_text_as_markdown(self.slides[4]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()